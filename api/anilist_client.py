@@ -6,6 +6,8 @@ import logging
 import requests
 from typing import Optional, Dict, Any, List
 
+from .http_session import get_shared_session
+
 
 logger = logging.getLogger(__name__)
 
@@ -15,27 +17,26 @@ class AniListClient:
     
     API_URL = "https://graphql.anilist.co"
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, session: Optional[requests.Session] = None):
         """
         Initialize AniList client.
         
         Args:
             api_key: Optional AniList API key for authenticated requests
+            session: Session to send requests through (defaults to the shared pooled session)
         """
         self.api_key = api_key
-        self.session = requests.Session()
+        self.session = session if session is not None else get_shared_session()
         
-        headers = {
+        # The session may be shared with other clients, so headers travel per request
+        self.headers = {
             'Content-Type': 'application/json',
-            'Accept': 'application/json',
-            'User-Agent': 'Media-Folder-Icon-Manager/1.0'
+            'Accept': 'application/json'
         }
         
         # Add authorization header if API key is provided
         if api_key:
-            headers['Authorization'] = f'Bearer {api_key}'
-            
-        self.session.headers.update(headers)
+            self.headers['Authorization'] = f'Bearer {api_key}'
     
     def test_api_key(self) -> bool:
         """
@@ -62,6 +63,7 @@ class AniListClient:
             response = self.session.post(
                 self.API_URL,
                 json={'query': query},
+                headers=self.headers,
                 timeout=10
             )
             
@@ -98,7 +100,7 @@ class AniListClient:
                 'variables': variables or {}
             }
             
-            response = self.session.post(self.API_URL, json=payload, timeout=30)
+            response = self.session.post(self.API_URL, json=payload, headers=self.headers, timeout=30)
             response.raise_for_status()
             
             data = response.json()
@@ -0,0 +1,44 @@
+"""
+Shared HTTP session for the API clients.
+
+TMDB and AniList clients are created in several places (setup validation,
+the main window, the scanner and the icon manager). Routing them all through
+one pooled session lets later requests reuse keep-alive TLS connections
+instead of paying a fresh handshake per client.
+"""
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+USER_AGENT = 'Media-Folder-Icon-Manager/1.0'
+POOL_SIZE = 32
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Get the process-wide pooled session, creating it on first use.
+
+    Client-specific state (API keys, auth headers) must be passed per
+    request rather than stored on this session.
+
+    Returns:
+        Shared requests session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({'User-Agent': USER_AGENT})
+                _session = session
+    return _session
@@ -8,6 +8,8 @@ import requests
 from typing import Optional, Dict, Any, List
 from urllib.parse import urljoin
 
+from .http_session import get_shared_session
+
 
 logger = logging.getLogger(__name__)
 
@@ -18,16 +20,20 @@ class TMDBClient:
     BASE_URL = "https://api.themoviedb.org/3/"
     IMAGE_BASE_URL = "https://image.tmdb.org/t/p/"
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, session: Optional[requests.Session] = None):
         """
         Initialize TMDB client.
         
         Args:
             api_key: TMDB API key
+            session: Session to send requests through (defaults to the shared pooled session)
         """
         self.api_key = api_key
         self.is_available = False
-        self.session = None
+        
+        # The session may be shared with other clients, so the key travels per request
+        self.session = session if session is not None else get_shared_session()
+        self._auth_params = {'api_key': self.api_key}
         
         if api_key:
             self._test_connection()
@@ -38,21 +44,15 @@ class TMDBClient:
         """Test if TMDB API is accessible."""
         try:
             # Quick connectivity test with minimal timeout
-            test_session = requests.Session()
-            test_session.params = {'api_key': self.api_key}
-            response = test_session.get(
+            response = self.session.get(
                 f"{self.BASE_URL}configuration", 
+                params=self._auth_params,
                 timeout=5  # Very short timeout for connection test
             )
             response.raise_for_status()
             
             # If we get here, connection is working
             self.is_available = True
-            self.session = requests.Session()
-            self.session.params = {'api_key': self.api_key}
-            self.session.headers.update({
-                'User-Agent': 'Media-Folder-Icon-Manager/1.0'
-            })
             logger.info("TMDB API connection successful")
             
         except Exception as e:
@@ -68,9 +68,9 @@ class TMDBClient:
         """
         try:
             # Use a simple endpoint to test the API key
-            response = requests.get(
+            response = self.session.get(
                 f"{self.BASE_URL}configuration",
-                params={'api_key': self.api_key},
+                params=self._auth_params,
                 timeout=10
             )
             
@@ -99,13 +99,13 @@ class TMDBClient:
         Returns:
             JSON response data or None if failed
         """
-        if not self.is_available or not self.session:
+        if not self.is_available:
             logger.debug(f"TMDB API not available, skipping request to {endpoint}")
             return None
             
         try:
             url = urljoin(self.BASE_URL, endpoint)
-            response = self.session.get(url, params=params, timeout=10)
+            response = self.session.get(url, params={**self._auth_params, **(params or {})}, timeout=10)
             response.raise_for_status()
             return response.json()
             
@@ -63,6 +63,11 @@ class AppSettings(BaseModel):
         config_dir = Path(__file__).parent
         return config_dir / "config.json"
     
+    @classmethod
+    def exists(cls) -> bool:
+        """Check if a settings file has been saved."""
+        return cls.get_config_path().exists()
+    
     @classmethod
     def load(cls) -> "AppSettings":
         """Load settings from file or create default."""
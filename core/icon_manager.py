@@ -4,11 +4,16 @@ Folder icon management for setting custom icons on Windows folders.
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from PIL import Image
 
-from utils.file_utils import create_desktop_ini, refresh_folder_icon, has_custom_icon, get_safe_filename
-from utils.image_utils import download_image, create_folder_icon, cache_poster, get_cached_poster
+from utils.file_utils import (
+    create_desktop_ini, refresh_folder_icon, refresh_folder_icons_bulk, has_custom_icon, get_safe_filename,
+    set_file_attributes, FILE_ATTRIBUTE_NORMAL
+)
+from utils.image_utils import (
+    download_image_data, download_images, create_folder_icon, create_folder_icons_bulk, cache_poster, get_cached_poster
+)
 from api.tmdb_client import TMDBClient
 from api.anilist_client import AniListClient
 
@@ -19,6 +24,9 @@ logger = logging.getLogger(__name__)
 class IconManager:
     """Manages folder icons for TV shows and anime."""
     
+    # Items per download/build round in batch_set_icons
+    BATCH_CHUNK_SIZE = 16
+    
     def __init__(self, tmdb_client: Optional[TMDBClient] = None, cache_dir: Optional[Path] = None):
         """
         Initialize the icon manager.
@@ -52,19 +60,13 @@ class IconManager:
             True if successful, False otherwise
         """
         if not force and has_custom_icon(folder_path):
-            logger.info(f"TV show {title} already has custom icon, skipping")
+            logger.info("TV show %s already has custom icon, skipping", title)
             return True
         
-        logger.info(f"Setting icon for TV show: {title}")
-        
-        # Get poster URL from TMDB
-        if not self.tmdb_client:
-            logger.error("TMDB client not available")
-            return False
+        logger.info("Setting icon for TV show: %s", title)
         
-        poster_url = self.tmdb_client.get_tv_poster(title, year)
+        poster_url = self._find_poster_url(title, year, "tv")
         if not poster_url:
-            logger.warning(f"No poster found for TV show: {title}")
             return False
         
         return self._create_and_set_icon(folder_path, title, poster_url, "tv")
@@ -83,20 +85,62 @@ class IconManager:
             True if successful, False otherwise
         """
         if not force and has_custom_icon(folder_path):
-            logger.info(f"Anime {title} already has custom icon, skipping")
+            logger.info("Anime %s already has custom icon, skipping", title)
             return True
         
-        logger.info(f"Setting icon for anime: {title}")
+        logger.info("Setting icon for anime: %s", title)
         
-        # Get poster URL from AniList
-        poster_url = self.anilist_client.get_anime_poster(title, year)
+        poster_url = self._find_poster_url(title, year, "anime")
         if not poster_url:
-            logger.warning(f"No poster found for anime: {title}")
             return False
         
         return self._create_and_set_icon(folder_path, title, poster_url, "anime")
     
-    def _create_and_set_icon(self, folder_path: Path, title: str, poster_url: str, media_type: str) -> bool:
+    def _find_poster_url(self, title: str, year: Optional[int], media_type: str) -> Optional[str]:
+        """
+        Look up the poster URL for a TV show (TMDB) or anime (AniList).
+        
+        Args:
+            title: Media title
+            year: First air / season year (optional)
+            media_type: Type of media (tv, anime)
+            
+        Returns:
+            Poster URL or None if not found
+        """
+        if media_type == "tv":
+            # Get poster URL from TMDB
+            if not self.tmdb_client:
+                logger.error("TMDB client not available")
+                return None
+            
+            poster_url = self.tmdb_client.get_tv_poster(title, year)
+            if not poster_url:
+                logger.warning("No poster found for TV show: %s", title)
+            return poster_url
+        
+        # Get poster URL from AniList
+        poster_url = self.anilist_client.get_anime_poster(title, year)
+        if not poster_url:
+            logger.warning("No poster found for anime: %s", title)
+        return poster_url
+    
+    def _icon_cache_entry(self, title: str, media_type: str) -> Tuple[str, Path]:
+        """
+        Get the cache key and cached icon path for a title.
+        
+        Args:
+            title: Media title
+            media_type: Type of media (tv, anime)
+            
+        Returns:
+            Tuple of (cache key, icon path)
+        """
+        cache_key = f"{media_type}_{get_safe_filename(title)}"
+        return cache_key, self.icon_cache_dir / f"{cache_key}.ico"
+    
+    def _create_and_set_icon(self, folder_path: Path, title: str, poster_url: str, media_type: str,
+                             refresh_paths: Optional[List[Path]] = None) -> bool:
         """
         Create icon from poster and set it for the folder.
         
@@ -105,49 +149,50 @@ class IconManager:
             title: Media title
             poster_url: URL to the poster image
             media_type: Type of media (tv, anime)
+            refresh_paths: Collects the folder for a later bulk Explorer refresh
+                instead of refreshing it now (optional)
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Create safe filename for caching
-            safe_title = get_safe_filename(title)
-            cache_key = f"{media_type}_{safe_title}"
-            
             # Check if icon is already cached
-            icon_path = self.icon_cache_dir / f"{cache_key}.ico"
+            cache_key, icon_path = self._icon_cache_entry(title, media_type)
             
             if not icon_path.exists():
                 # Download and cache poster
-                logger.debug(f"Downloading poster from: {poster_url}")
-                poster_image = download_image(poster_url)
+                logger.debug("Downloading poster from: %s", poster_url)
+                poster_image, poster_bytes = download_image_data(poster_url)
                 if not poster_image:
                     return False
                 
                 # Cache the poster
-                poster_cache_path = cache_poster(poster_image, self.poster_cache_dir, cache_key)
+                poster_cache_path = cache_poster(poster_image, self.poster_cache_dir, cache_key, poster_bytes)
                 if not poster_cache_path:
                     return False
                 
                 # Create icon from poster
-                logger.debug(f"Creating icon: {icon_path}")
+                logger.debug("Creating icon: %s", icon_path)
                 if not create_folder_icon(poster_image, icon_path):
                     return False
             else:
-                logger.debug(f"Using cached icon: {icon_path}")
+                logger.debug("Using cached icon: %s", icon_path)
             
             # Create desktop.ini and set folder attributes
             if not create_desktop_ini(folder_path, icon_path):
                 return False
             
-            # Refresh folder icon in Explorer
-            refresh_folder_icon(folder_path)
+            # Refresh folder icon in Explorer (deferred when the caller batches refreshes)
+            if refresh_paths is not None:
+                refresh_paths.append(folder_path)
+            else:
+                refresh_folder_icon(folder_path)
             
-            logger.info(f"Successfully set icon for {media_type}: {title}")
+            logger.info("Successfully set icon for %s: %s", media_type, title)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to set icon for {title}: {e}")
+            logger.error("Failed to set icon for %s: %s", title, e)
             return False
     
     def remove_icon(self, folder_path: Path) -> bool:
@@ -166,11 +211,10 @@ class IconManager:
             if desktop_ini_path.exists():
                 # Remove desktop.ini file
                 desktop_ini_path.unlink()
-                logger.info(f"Removed desktop.ini from {folder_path}")
+                logger.info("Removed desktop.ini from %s", folder_path)
             
             # Remove read-only attribute from folder
-            import ctypes
-            ctypes.windll.kernel32.SetFileAttributesW(str(folder_path), 0x80)  # FILE_ATTRIBUTE_NORMAL
+            set_file_attributes(folder_path, FILE_ATTRIBUTE_NORMAL)
             
             # Refresh folder icon
             refresh_folder_icon(folder_path)
@@ -178,17 +222,25 @@ class IconManager:
             return True
             
         except Exception as e:
-            logger.error(f"Failed to remove icon from {folder_path}: {e}")
+            logger.error("Failed to remove icon from %s: %s", folder_path, e)
             return False
     
-    def batch_set_icons(self, items: list, media_type: str, progress_callback=None) -> dict:
+    def batch_set_icons(self, items: list, media_type: str, progress_callback=None,
+                        refresh_paths: Optional[List[Path]] = None) -> dict:
         """
         Set icons for multiple items in batch.
         
+        Items are handled in chunks of BATCH_CHUNK_SIZE. Poster URLs are looked
+        up one item at a time (the metadata APIs are rate limited), the chunk's
+        missing posters are downloaded concurrently and their icons built in
+        parallel, and then each item's icon is applied and reported.
+        
         Args:
             items: List of media items
             media_type: Type of media (tv_shows, anime)
             progress_callback: Callback function for progress updates
+            refresh_paths: Collects the folders to refresh in Explorer; when
+                omitted, the batch refreshes its own folders once at the end
             
         Returns:
             Dictionary with success/failure counts
@@ -196,34 +248,46 @@ class IconManager:
         total = len(items)
         successful = 0
         failed = 0
+        item_type = {'tv_shows': "tv", 'anime': "anime"}.get(media_type)
         
-        logger.info(f"Starting batch icon setting for {total} {media_type}")
+        logger.info("Starting batch icon setting for %s %s", total, media_type)
         
-        for i, item in enumerate(items):
-            try:
-                folder_path = item['path']
-                title = item['title']
-                year = item.get('year')
-                
-                if media_type == 'tv_shows':
-                    success = self.set_tv_show_icon(folder_path, title, year)
-                elif media_type == 'anime':
-                    success = self.set_anime_icon(folder_path, title, year)
-                else:
-                    success = False
-                
-                if success:
-                    successful += 1
-                else:
-                    failed += 1
+        # Explorer is refreshed once for the whole batch instead of once per folder
+        own_refresh = refresh_paths is None
+        if own_refresh:
+            refresh_paths = []
+        try:
+            for start in range(0, total, self.BATCH_CHUNK_SIZE):
+                chunk = items[start:start + self.BATCH_CHUNK_SIZE]
+                outcomes, poster_urls = self._build_batch_icons(chunk, item_type)
                 
-                # Call progress callback if provided
-                if progress_callback:
-                    progress_callback(i + 1, total, title, success)
+                for offset, item in enumerate(chunk):
+                    title = item.get('title', 'unknown')
+                    try:
+                        success = outcomes[offset]
+                        if success is None:
+                            # The icon is cached by now, so this only applies it
+                            success = self._create_and_set_icon(
+                                item['path'], title, poster_urls[offset], item_type, refresh_paths
+                            )
+                    except Exception as e:
+                        logger.error("Error processing %s: %s", title, e)
+                        success = False
                     
-            except Exception as e:
-                logger.error(f"Error processing {item.get('title', 'unknown')}: {e}")
-                failed += 1
+                    if success:
+                        successful += 1
+                    else:
+                        failed += 1
+                    
+                    # Call progress callback if provided
+                    if progress_callback:
+                        try:
+                            progress_callback(start + offset + 1, total, title, success)
+                        except Exception as e:
+                            logger.error("Progress callback failed for %s: %s", title, e)
+        finally:
+            if own_refresh:
+                refresh_folder_icons_bulk(refresh_paths)
         
         result = {
             'total': total,
@@ -231,9 +295,80 @@ class IconManager:
             'failed': failed
         }
         
-        logger.info(f"Batch complete: {successful}/{total} successful")
+        logger.info("Batch complete: %s/%s successful", successful, total)
         return result
     
+    @staticmethod
+    def _item_has_custom_icon(item: dict) -> bool:
+        """Use the scanned has_custom_icon flag, checking the folder only when it is missing."""
+        flag = item.get('has_custom_icon')
+        if flag is None:
+            return has_custom_icon(item['path'])
+        return bool(flag)
+    
+    def _build_batch_icons(self, chunk: list, item_type: Optional[str]) -> Tuple[List[Optional[bool]], Dict[int, str]]:
+        """
+        Look up posters for a chunk of batch items and build their missing icons.
+        
+        Args:
+            chunk: Media items
+            item_type: Type of media (tv, anime), or None if unsupported
+            
+        Returns:
+            Tuple of (outcome per item: True if already done, False if failed,
+            None if its icon is ready to apply; poster URLs by position)
+        """
+        outcomes: List[Optional[bool]] = [None] * len(chunk)
+        poster_urls: Dict[int, str] = {}
+        
+        for offset, item in enumerate(chunk):
+            try:
+                if item_type is None:
+                    outcomes[offset] = False
+                elif self._item_has_custom_icon(item):
+                    logger.info("%s already has custom icon, skipping", item['title'])
+                    outcomes[offset] = True
+                else:
+                    logger.info("Setting icon for %s: %s", "TV show" if item_type == "tv" else "anime", item['title'])
+                    poster_url = self._find_poster_url(item['title'], item.get('year'), item_type)
+                    if poster_url:
+                        poster_urls[offset] = poster_url
+                    else:
+                        outcomes[offset] = False
+            except Exception as e:
+                logger.error("Error processing %s: %s", item.get('title', 'unknown'), e)
+                outcomes[offset] = False
+        
+        # One download and build per icon file, even when several items share a title
+        to_build: Dict[Path, List[int]] = {}
+        cache_keys: Dict[Path, str] = {}
+        for offset in poster_urls:
+            cache_key, icon_path = self._icon_cache_entry(chunk[offset]['title'], item_type)
+            if not icon_path.exists():
+                to_build.setdefault(icon_path, []).append(offset)
+                cache_keys[icon_path] = cache_key
+        
+        icon_paths = list(to_build)
+        posters = download_images([poster_urls[to_build[icon_path][0]] for icon_path in icon_paths])
+        
+        icon_jobs = []
+        for icon_path, (poster_image, poster_bytes) in zip(icon_paths, posters):
+            if poster_image is not None and cache_poster(
+                    poster_image, self.poster_cache_dir, cache_keys[icon_path], poster_bytes):
+                icon_jobs.append((poster_image, icon_path))
+            else:
+                for offset in to_build[icon_path]:
+                    outcomes[offset] = False
+        
+        logger.debug("Creating %s icons", len(icon_jobs))
+        built = create_folder_icons_bulk(icon_jobs)
+        for (_, icon_path), ok in zip(icon_jobs, built):
+            if not ok:
+                for offset in to_build[icon_path]:
+                    outcomes[offset] = False
+        
+        return outcomes, poster_urls
+    
     def clean_icon_cache(self, max_age_days: int = 30) -> int:
         """
         Clean old cached icons and posters.
@@ -250,7 +385,7 @@ class IconManager:
         icon_deleted = clean_cache(self.icon_cache_dir, max_age_days)
         
         total_deleted = poster_deleted + icon_deleted
-        logger.info(f"Cache cleanup completed: {total_deleted} files deleted")
+        logger.info("Cache cleanup completed: %s files deleted", total_deleted)
         return total_deleted
     
     def get_cache_stats(self) -> dict:
@@ -278,7 +413,7 @@ class IconManager:
             }
             
         except Exception as e:
-            logger.error(f"Failed to get cache stats: {e}")
+            logger.error("Failed to get cache stats: %s", e)
             return {
                 'poster_count': 0,
                 'icon_count': 0,
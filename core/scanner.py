@@ -3,13 +3,16 @@ Directory scanning and media detection functionality.
 """
 
 import logging
-import re
+import os
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable
 from dataclasses import dataclass
 from datetime import datetime
 
-from utils.file_utils import scan_movies, scan_tv_shows, is_video_file, clean_title
+from utils.file_utils import (
+    scan_movies, scan_tv_shows, is_video_file, has_video_extension, is_season_folder, clean_title
+)
 from api.anilist_client import AniListClient
 
 
@@ -167,8 +170,7 @@ class MediaScanner:
                 elif item.is_dir():
                     total_folders += 1
                     # Check if it looks like a TV show folder
-                    if any(re.search(r'season\s*\d+', sub.name, re.IGNORECASE) 
-                          for sub in item.iterdir() if sub.is_dir()):
+                    if any(is_season_folder(sub.name) for sub in item.iterdir() if sub.is_dir()):
                         tv_folders += 1
         
         except Exception as e:
@@ -181,6 +183,33 @@ class MediaScanner:
             'total_folders': total_folders
         }
     
+    def check_directory_access(self, directory: Path) -> Optional[str]:
+        """
+        Check that a directory exists and can be listed.
+        
+        Args:
+            directory: Directory to check
+            
+        Returns:
+            Error message, or None if the directory is accessible
+        """
+        try:
+            if not directory.exists():
+                return 'Directory does not exist'
+            
+            if not directory.is_dir():
+                return 'Path is not a directory'
+            
+            # Try to list directory contents
+            with os.scandir(directory) as it:
+                next(it, None)
+        except PermissionError:
+            return 'Permission denied'
+        except Exception as e:
+            return f'Cannot access directory: {e}'
+        
+        return None
+    
     def validate_directory(self, directory: Path) -> Dict[str, Any]:
         """
         Validate if directory is suitable for media scanning.
@@ -191,35 +220,69 @@ class MediaScanner:
         Returns:
             Validation result dictionary
         """
-        if not directory.exists():
+        error = self.check_directory_access(directory)
+        if error:
             return {
                 'valid': False,
-                'error': 'Directory does not exist'
+                'error': error
             }
         
-        if not directory.is_dir():
+        # Check if directory contains media files
+        quick_scan = self.quick_scan(directory)
+        if quick_scan.get('error'):
             return {
                 'valid': False,
-                'error': 'Path is not a directory'
+                'error': 'Failed to scan directory'
             }
         
-        try:
-            # Try to list directory contents
-            list(directory.iterdir())
-        except PermissionError:
-            return {
-                'valid': False,
-                'error': 'Permission denied'
-            }
-        except Exception as e:
+        return {
+            'valid': True,
+            'stats': quick_scan
+        }
+    
+    def validate_directory_fast(self, directory: Path, entries: Iterable[os.DirEntry]) -> Dict[str, Any]:
+        """
+        Validate a directory from an already-walked stream of directory entries.
+        
+        Produces the same result as validate_directory, but the statistics are
+        computed from os.DirEntry objects (whose type information is cached by
+        os.scandir) instead of walking the tree again with pathlib.
+        
+        Args:
+            directory: Directory to validate
+            entries: Directory entries below the directory
+            
+        Returns:
+            Validation result dictionary
+        """
+        error = self.check_directory_access(directory)
+        if error:
             return {
                 'valid': False,
-                'error': f'Cannot access directory: {e}'
+                'error': error
             }
         
-        # Check if directory contains media files
-        quick_scan = self.quick_scan(directory)
-        if quick_scan.get('error'):
+        root = os.fspath(directory)
+        video_files = 0
+        total_folders = 0
+        tv_folders = set()
+        
+        try:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    total_folders += 1
+                    # A season folder marks its parent as a TV show folder
+                    if is_season_folder(entry.name):
+                        parent = os.path.dirname(entry.path)
+                        if parent != root:
+                            tv_folders.add(parent)
+                else:
+                    # Classify by suffix with a set lookup, without building a Path
+                    if has_video_extension(entry.name) and entry.is_file():
+                        video_files += 1
+        
+        except Exception as e:
+            logger.error(f"Directory validation scan failed: {e}")
             return {
                 'valid': False,
                 'error': 'Failed to scan directory'
@@ -227,5 +290,31 @@ class MediaScanner:
         
         return {
             'valid': True,
-            'stats': quick_scan
+            'stats': {
+                'video_files': video_files,
+                'tv_folders': len(tv_folders),
+                'total_folders': total_folders
+            }
         }
+
+
+_shared_scanner: Optional[MediaScanner] = None
+_shared_scanner_lock = threading.Lock()
+
+
+def get_shared_scanner() -> MediaScanner:
+    """
+    Get a process-wide MediaScanner, creating it on first use.
+    
+    Intended for read-only helpers such as directory validation, which can be
+    called from several threads without creating a scanner each time.
+    
+    Returns:
+        Shared MediaScanner instance
+    """
+    global _shared_scanner
+    if _shared_scanner is None:
+        with _shared_scanner_lock:
+            if _shared_scanner is None:
+                _shared_scanner = MediaScanner()
+    return _shared_scanner
@@ -4,7 +4,7 @@ Background task scheduling and automation.
 
 import logging
 from datetime import datetime, timedelta
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 from threading import Thread, Event
 from pathlib import Path
 
@@ -16,6 +16,7 @@ from config.settings import AppSettings
 from core.scanner import MediaScanner
 from core.icon_manager import IconManager
 from core.thumbnail_embedder import ThumbnailEmbedder
+from utils.file_utils import refresh_folder_icons_bulk
 
 
 logger = logging.getLogger(__name__)
@@ -85,7 +86,7 @@ class TaskScheduler:
             max_instances=1  # Prevent overlapping scans
         )
         
-        logger.info(f"Scheduled periodic scan every {self.settings.scan_frequency} hours")
+        logger.info("Scheduled periodic scan every %s hours", self.settings.scan_frequency)
     
     def _perform_scheduled_scan(self) -> None:
         """Perform a scheduled media scan."""
@@ -118,7 +119,7 @@ class TaskScheduler:
             logger.info("Scheduled scan completed successfully")
             
         except Exception as e:
-            logger.error(f"Scheduled scan failed: {e}")
+            logger.error("Scheduled scan failed: %s", e)
             if self.scan_error_callback:
                 self.scan_error_callback(str(e))
         finally:
@@ -159,7 +160,7 @@ class TaskScheduler:
                 logger.info("Manual scan completed successfully")
                 
             except Exception as e:
-                logger.error(f"Manual scan failed: {e}")
+                logger.error("Manual scan failed: %s", e)
                 if self.scan_error_callback:
                     self.scan_error_callback(str(e))
             finally:
@@ -194,39 +195,24 @@ class TaskScheduler:
             if progress_callback:
                 progress_callback(completed_tasks, total_tasks, message)
         
-        # Set TV show icons
-        if self.settings.features.tv_shows and scan_result.tv_shows:
-            logger.info(f"Setting icons for {len(scan_result.tv_shows)} TV shows")
-            for tv_show in scan_result.tv_shows:
-                try:
-                    self.icon_manager.set_tv_show_icon(
-                        tv_show['path'],
-                        tv_show['title'],
-                        tv_show.get('year')
-                    )
-                    update_progress(f"Set icon for TV show: {tv_show['title']}")
-                except Exception as e:
-                    logger.error(f"Failed to set icon for {tv_show['title']}: {e}")
-                    update_progress(f"Failed to set icon for: {tv_show['title']}")
-        
-        # Set anime icons
-        if self.settings.features.anime and scan_result.anime:
-            logger.info(f"Setting icons for {len(scan_result.anime)} anime")
-            for anime in scan_result.anime:
-                try:
-                    self.icon_manager.set_anime_icon(
-                        anime['path'],
-                        anime['title'],
-                        anime.get('year')
-                    )
-                    update_progress(f"Set icon for anime: {anime['title']}")
-                except Exception as e:
-                    logger.error(f"Failed to set icon for {anime['title']}: {e}")
-                    update_progress(f"Failed to set icon for: {anime['title']}")
+        # Folders whose icons were set; Explorer is refreshed once for all of them
+        refresh_paths: List[Path] = []
+        try:
+            # Set TV show icons
+            if self.settings.features.tv_shows and scan_result.tv_shows:
+                logger.info("Setting icons for %s TV shows", len(scan_result.tv_shows))
+                self._set_icons(scan_result.tv_shows, 'tv_shows', "TV show", update_progress, refresh_paths)
+            
+            # Set anime icons
+            if self.settings.features.anime and scan_result.anime:
+                logger.info("Setting icons for %s anime", len(scan_result.anime))
+                self._set_icons(scan_result.anime, 'anime', "anime", update_progress, refresh_paths)
+        finally:
+            refresh_folder_icons_bulk(refresh_paths)
         
         # Embed movie thumbnails
         if self.settings.features.movies and scan_result.movies:
-            logger.info(f"Embedding thumbnails for {len(scan_result.movies)} movies")
+            logger.info("Embedding thumbnails for %s movies", len(scan_result.movies))
             for movie in scan_result.movies:
                 try:
                     self.thumbnail_embedder.embed_movie_thumbnail(
@@ -236,9 +222,37 @@ class TaskScheduler:
                     )
                     update_progress(f"Embedded thumbnail for: {movie['title']}")
                 except Exception as e:
-                    logger.error(f"Failed to embed thumbnail for {movie['title']}: {e}")
+                    logger.error("Failed to embed thumbnail for %s: %s", movie['title'], e)
                     update_progress(f"Failed to embed thumbnail for: {movie['title']}")
     
+    def _set_icons(self, items: list, media_type: str, label: str, update_progress: Callable,
+                   refresh_paths: List[Path]) -> None:
+        """
+        Set icons for scanned items in one batch, reporting progress per item.
+        
+        Args:
+            items: Scanned media items
+            media_type: Type of media (tv_shows, anime)
+            label: Media type name for progress messages
+            update_progress: Progress callback taking a message
+            refresh_paths: Collects the folders to refresh in Explorer
+        """
+        def on_item_done(current: int, total: int, title: str, success: bool):
+            item = items[current - 1]
+            if success and 'has_custom_icon' in item:
+                # Keep the flag recorded by the scan in step with the icon just set
+                item['has_custom_icon'] = True
+            
+            if success:
+                update_progress(f"Set icon for {label}: {title}")
+            else:
+                update_progress(f"Failed to set icon for: {title}")
+        
+        try:
+            self.icon_manager.batch_set_icons(items, media_type, on_item_done, refresh_paths)
+        except Exception as e:
+            logger.error("Failed to set %s icons: %s", label, e)
+    
     def schedule_cache_cleanup(self) -> None:
         """Schedule periodic cache cleanup."""
         try:
@@ -261,9 +275,9 @@ class TaskScheduler:
         """Clean up old cache files."""
         try:
             deleted_count = self.icon_manager.clean_icon_cache(max_age_days=30)
-            logger.info(f"Cache cleanup completed: {deleted_count} files deleted")
+            logger.info("Cache cleanup completed: %s files deleted", deleted_count)
         except Exception as e:
-            logger.error(f"Cache cleanup failed: {e}")
+            logger.error("Cache cleanup failed: %s", e)
     
     def update_schedule(self, new_frequency: int) -> None:
         """
@@ -274,7 +288,7 @@ class TaskScheduler:
         """
         self.settings.scan_frequency = new_frequency
         self._schedule_periodic_scan()
-        logger.info(f"Updated scan frequency to {new_frequency} hours")
+        logger.info("Updated scan frequency to %s hours", new_frequency)
     
     def get_next_scan_time(self) -> Optional[datetime]:
         """
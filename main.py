@@ -41,13 +41,13 @@ def main():
     # Check if this is first run
     if not settings.is_configured():
         logger.info("First run detected, showing setup dialog")
-        setup_dialog = SetupDialog()
+        setup_dialog = SetupDialog(settings=settings)
         if setup_dialog.exec() != setup_dialog.Accepted:
             logger.info("Setup cancelled, exiting")
             return 0
         
-        # Reload settings after setup
-        settings = AppSettings.load()
+        # Use the configured settings directly; the dialog writes them to disk in the background
+        settings = setup_dialog.settings
     
     # Create main window
     main_window = MainWindow(settings)
@@ -12,9 +12,9 @@ from PySide6.QtWidgets import (
     QLabel, QPushButton, QTextEdit, QTableWidget, QTableWidgetItem,
     QProgressBar, QGroupBox, QFormLayout, QLineEdit, QSpinBox,
     QCheckBox, QMessageBox, QSplitter, QHeaderView, QStatusBar,
-    QMenuBar, QMenu, QToolBar, QFileDialog
+    QMenuBar, QMenu, QToolBar, QFileDialog, QApplication
 )
-from PySide6.QtCore import Qt, QTimer, Signal, QThread
+from PySide6.QtCore import Qt, QTimer, Signal, QThread, QObject, QRunnable, QThreadPool
 from PySide6.QtGui import QAction, QIcon, QPixmap
 
 from config.settings import AppSettings
@@ -52,6 +52,30 @@ class ScanWorker(QThread):
             self.scan_error.emit(str(e))
 
 
+class SchedulerStopSignals(QObject):
+    """Signals emitted by SchedulerStopRunnable."""
+    
+    finished = Signal()
+
+
+class SchedulerStopRunnable(QRunnable):
+    """Runnable that stops the task scheduler off the UI thread."""
+    
+    def __init__(self, scheduler: TaskScheduler):
+        super().__init__()
+        self.scheduler = scheduler
+        self.signals = SchedulerStopSignals()
+    
+    def run(self):
+        """Stop the scheduler in background."""
+        try:
+            self.scheduler.stop()
+        except Exception as e:
+            logger.error(f"Failed to stop scheduler: {e}")
+        finally:
+            self.signals.finished.emit()
+
+
 class MainWindow(QMainWindow):
     """Main application window."""
     
@@ -59,6 +83,7 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.settings = settings
         self.scan_worker = None
+        self.stop_runnable = None
         
         # Initialize components
         self._init_api_clients()
@@ -512,42 +537,61 @@ class MainWindow(QMainWindow):
     
     def _update_movies_table(self, movies):
         """Update the movies table."""
-        self.movies_table.setRowCount(len(movies))
-        
-        for row, movie in enumerate(movies):
-            self.movies_table.setItem(row, 0, QTableWidgetItem(movie['title']))
-            self.movies_table.setItem(row, 1, QTableWidgetItem(str(movie.get('year', ''))))
-            self.movies_table.setItem(row, 2, QTableWidgetItem(str(movie['path'])))
+        self.movies_table.blockSignals(True)
+        try:
+            self.movies_table.setRowCount(len(movies))
             
-            # Check if has thumbnail
-            has_thumb = self.thumbnail_embedder.has_embedded_thumbnail(movie['path'])
-            self.movies_table.setItem(row, 3, QTableWidgetItem("Yes" if has_thumb else "No"))
+            for row, movie in enumerate(movies):
+                self.movies_table.setItem(row, 0, QTableWidgetItem(movie['title']))
+                self.movies_table.setItem(row, 1, QTableWidgetItem(str(movie.get('year', ''))))
+                self.movies_table.setItem(row, 2, QTableWidgetItem(str(movie['path'])))
+                
+                # Check if has thumbnail
+                has_thumb = self.thumbnail_embedder.has_embedded_thumbnail(movie['path'])
+                self.movies_table.setItem(row, 3, QTableWidgetItem("Yes" if has_thumb else "No"))
+        finally:
+            self.movies_table.blockSignals(False)
+            self.movies_table.viewport().update()
     
     def _update_tv_shows_table(self, tv_shows):
         """Update the TV shows table."""
-        self.tv_shows_table.setRowCount(len(tv_shows))
-        
-        for row, show in enumerate(tv_shows):
-            self.tv_shows_table.setItem(row, 0, QTableWidgetItem(show['title']))
-            self.tv_shows_table.setItem(row, 1, QTableWidgetItem(str(show['path'])))
+        self.tv_shows_table.blockSignals(True)
+        try:
+            self.tv_shows_table.setRowCount(len(tv_shows))
             
-            # Check if has icon
-            from utils.file_utils import has_custom_icon
-            has_icon = has_custom_icon(show['path'])
-            self.tv_shows_table.setItem(row, 2, QTableWidgetItem("Yes" if has_icon else "No"))
+            for row, show in enumerate(tv_shows):
+                self.tv_shows_table.setItem(row, 0, QTableWidgetItem(show['title']))
+                self.tv_shows_table.setItem(row, 1, QTableWidgetItem(str(show['path'])))
+                
+                # Check if has icon (scan_tv_shows records it from its directory listing)
+                has_icon = show.get('has_custom_icon')
+                if has_icon is None:
+                    from utils.file_utils import has_custom_icon
+                    has_icon = has_custom_icon(show['path'])
+                self.tv_shows_table.setItem(row, 2, QTableWidgetItem("Yes" if has_icon else "No"))
+        finally:
+            self.tv_shows_table.blockSignals(False)
+            self.tv_shows_table.viewport().update()
     
     def _update_anime_table(self, anime):
         """Update the anime table."""
-        self.anime_table.setRowCount(len(anime))
-        
-        for row, item in enumerate(anime):
-            self.anime_table.setItem(row, 0, QTableWidgetItem(item['title']))
-            self.anime_table.setItem(row, 1, QTableWidgetItem(str(item['path'])))
+        self.anime_table.blockSignals(True)
+        try:
+            self.anime_table.setRowCount(len(anime))
             
-            # Check if has icon
-            from utils.file_utils import has_custom_icon
-            has_icon = has_custom_icon(item['path'])
-            self.anime_table.setItem(row, 2, QTableWidgetItem("Yes" if has_icon else "No"))
+            for row, item in enumerate(anime):
+                self.anime_table.setItem(row, 0, QTableWidgetItem(item['title']))
+                self.anime_table.setItem(row, 1, QTableWidgetItem(str(item['path'])))
+                
+                # Check if has icon (scan_tv_shows records it from its directory listing)
+                has_icon = item.get('has_custom_icon')
+                if has_icon is None:
+                    from utils.file_utils import has_custom_icon
+                    has_icon = has_custom_icon(item['path'])
+                self.anime_table.setItem(row, 2, QTableWidgetItem("Yes" if has_icon else "No"))
+        finally:
+            self.anime_table.blockSignals(False)
+            self.anime_table.viewport().update()
     
     def _update_statistics(self, scan_result):
         """Update statistics display."""
@@ -689,7 +733,13 @@ class MainWindow(QMainWindow):
         else:
             # Actually close the application
             remove_gui_logging()
-            if hasattr(self, 'scheduler'):
-                self.scheduler.stop()
             event.accept()
             logger.info("Application closing")
+            
+            # Stop the scheduler without blocking the UI thread, quit when done
+            if hasattr(self, 'scheduler'):
+                self.stop_runnable = SchedulerStopRunnable(self.scheduler)
+                self.stop_runnable.signals.finished.connect(QApplication.instance().quit)
+                QThreadPool.globalInstance().start(self.stop_runnable)
+            else:
+                QApplication.instance().quit()
@@ -2,89 +2,450 @@
 Initial setup dialog for first-time configuration.
 """
 
+import hashlib
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Optional, Tuple
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel, 
+    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QGridLayout, QLabel, 
     QLineEdit, QPushButton, QFileDialog, QCheckBox, QSpinBox,
-    QTextEdit, QTabWidget, QWidget, QGroupBox, QMessageBox
+    QTabWidget, QWidget, QGroupBox, QMessageBox
 )
-from PySide6.QtCore import Qt, QThread, Signal
-from PySide6.QtGui import QPixmap, QIcon
+from PySide6.QtCore import Qt, QObject, QRunnable, QSignalBlocker, QThreadPool, QTimer, Signal
 
 from config.settings import AppSettings
-from api.tmdb_client import TMDBClient
-from core.scanner import MediaScanner
+
+# The API clients and scanner pull in requests and the scanning stack, so they
+# are imported by the worker on first use rather than when the dialog opens
+if TYPE_CHECKING:
+    from api.tmdb_client import TMDBClient
 
 
 logger = logging.getLogger(__name__)
 
+# Number of files a sampled directory validation looks at before stopping
+_VALIDATION_SAMPLE_LIMIT = 2000
+
+# Number of scanned entries between validation progress updates
+_VALIDATION_PROGRESS_INTERVAL = 500
+
+# Number of directory validation results remembered per dialog
+_DIR_STAT_CACHE_SIZE = 8
+
+# Seconds a successful API key check is trusted before probing the service again
+_KEY_CHECK_TTL = 600
+
+# Widget styles, shared so identical stylesheets are only parsed once
+_STYLE_TITLE = "font-size: 18px; font-weight: bold; margin: 10px;"
+_STYLE_DESCRIPTION = "margin: 10px; color: #666;"
+
+# Static rich text shown in the tabs, built once per process
+_API_INFO_HTML = """
+<p>To use this application optimally, you can configure API keys for enhanced features:</p>
+<ul>
+<li><strong>TMDB:</strong> Required for movie and TV show metadata</li>
+<li><strong>AniList:</strong> Optional for enhanced anime features (public API works without key)</li>
+</ul>
+"""
+
+_TMDB_INSTRUCTIONS_HTML = """
+<small>Get your free TMDB API key from: 
+<a href="https://www.themoviedb.org/settings/api">https://www.themoviedb.org/settings/api</a></small>
+"""
+
+_ANILIST_INSTRUCTIONS_HTML = """
+<small>AniList API key is optional. The app works with public API, but authenticated requests provide more features. 
+Get your key from: <a href="https://anilist.co/settings/developer">https://anilist.co/settings/developer</a></small>
+"""
+
+_REQUIREMENTS_HTML = """
+<b>For movie thumbnail embedding:</b><br>
+• FFmpeg executable must be placed in the assets/ffmpeg/ folder<br>
+• Download from: <a href="https://ffmpeg.org/download.html">https://ffmpeg.org/download.html</a><br><br>
+
+<b>Supported video formats:</b><br>
+• MP4, MKV, AVI, MOV, WMV, and others<br><br>
+
+<b>Note:</b> Icon creation requires write permissions to your media folders.
+"""
+
+
+@lru_cache(maxsize=4)
+def _load_settings_for_stat(stat_key: Tuple[int, int]) -> AppSettings:
+    """Load settings from disk, memoized by config file (mtime, size)."""
+    return AppSettings.load()
+
+
+def _cached_settings_load() -> AppSettings:
+    """
+    Load application settings, reusing the parsed result while the config file is unchanged.
+    
+    Returns:
+        A private copy of the loaded settings
+    """
+    if not AppSettings.exists():
+        return AppSettings()
+    
+    try:
+        stat = AppSettings.get_config_path().stat()
+    except FileNotFoundError:
+        return AppSettings()
+    
+    return _load_settings_for_stat((stat.st_mtime_ns, stat.st_size)).copy(deep=True)
+
+
+_key_check_cache: Dict[Tuple[str, str], float] = {}
+_key_check_lock = threading.Lock()
+
+
+def _cached_key_check(service: str, api_key: str, check: Callable[[], bool]) -> bool:
+    """
+    Run an API key check unless the same key passed it within the TTL.
+    
+    Only successful checks are remembered, so a transient network failure is
+    retried on the next validation. Keys are stored as hashes.
+    
+    Args:
+        service: Name of the service the key belongs to
+        api_key: API key being checked
+        check: Callable performing the actual network probe
+        
+    Returns:
+        True if the key is valid, False otherwise
+    """
+    cache_key = (service, hashlib.sha256(api_key.encode('utf-8')).hexdigest())
+    now = time.monotonic()
+    with _key_check_lock:
+        checked_at = _key_check_cache.get(cache_key)
+    if checked_at is not None and now - checked_at < _KEY_CHECK_TTL:
+        logger.debug(f"Using cached {service} API key check")
+        return True
+    
+    valid = check()
+    with _key_check_lock:
+        if valid:
+            _key_check_cache[cache_key] = now
+        else:
+            _key_check_cache.pop(cache_key, None)
+    return valid
+
+
+def _scandir_breadth_first(path: str) -> Iterator[os.DirEntry]:
+    """
+    Yield the directory entries below a path breadth-first using os.scandir.
+    
+    Walking level by level means a truncated walk still samples every top-level
+    folder. Symlinks and hidden (dot) folders are skipped, each physical folder is
+    visited once even if it is reachable twice (e.g. through an NTFS junction), and
+    directories that cannot be read are ignored.
+    
+    Args:
+        path: Directory to walk
+        
+    Yields:
+        os.DirEntry objects for every file and folder below the path
+    """
+    visited = set()
+    pending = deque([path])
+    while pending:
+        current = pending.popleft()
+        try:
+            stat = os.stat(current)
+            folder_id = (stat.st_dev, stat.st_ino)
+            if folder_id in visited:
+                continue
+            visited.add(folder_id)
+            
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_symlink():
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name.startswith('.'):
+                            continue
+                        pending.append(entry.path)
+                    yield entry
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory {current}: {e}")
+
 
-class ValidationWorker(QThread):
-    """Worker thread for validating settings."""
+class ValidationSignals(QObject):
+    """Signals emitted by ValidationRunnable."""
     
-    validation_complete = Signal(dict)
+    validation_complete = Signal(int, dict)  # job_id, result
+    progress = Signal(int, int, int)  # job_id, files_seen, dirs_seen
+
+
+class ValidationRunnable(QRunnable):
+    """Runnable that validates settings on the global thread pool."""
     
-    def __init__(self, media_directory: str, tmdb_api_key: str, anilist_api_key: str = ""):
+    def __init__(self, job_id: int, media_directory: str, tmdb_api_key: str, anilist_api_key: str = "",
+                 sample_limit: int = _VALIDATION_SAMPLE_LIMIT,
+                 tmdb_clients: Optional[Dict[str, "TMDBClient"]] = None,
+                 dir_stat_cache: Optional["OrderedDict[Tuple[str, int, int], dict]"] = None,
+                 dir_stat_lock: Optional[threading.Lock] = None):
         super().__init__()
+        self.job_id = job_id
         self.media_directory = media_directory
         self.tmdb_api_key = tmdb_api_key
+        self.tmdb_clients = tmdb_clients if tmdb_clients is not None else {}
+        self.dir_stat_cache = dir_stat_cache if dir_stat_cache is not None else OrderedDict()
+        # Runnables from one dialog share the cache across pool threads
+        self.dir_stat_lock = dir_stat_lock if dir_stat_lock is not None else threading.Lock()
         self.anilist_api_key = anilist_api_key
+        self.sample_limit = sample_limit  # 0 scans every file
+        self.sampled = False
+        self.signals = ValidationSignals()
+        self._cancelled = threading.Event()
+    
+    def cancel(self):
+        """Ask the validation to stop at its next check (called from the GUI thread)."""
+        self._cancelled.set()
+    
+    def _is_cancelled(self) -> bool:
+        """Check whether the validation has been cancelled."""
+        return self._cancelled.is_set()
+    
+    def _iter_entries(self, directory: str) -> Iterator[os.DirEntry]:
+        """Walk the directory, stopping early once the sample limit is reached."""
+        files_seen = 0
+        dirs_seen = 0
+        for entry in _scandir_breadth_first(directory):
+            if self._is_cancelled():
+                return
+            yield entry
+            if entry.is_dir(follow_symlinks=False):
+                dirs_seen += 1
+            else:
+                files_seen += 1
+                if self.sample_limit and files_seen >= self.sample_limit:
+                    self.sampled = True
+                    return
+            
+            if (files_seen + dirs_seen) % _VALIDATION_PROGRESS_INTERVAL == 0:
+                self.signals.progress.emit(self.job_id, files_seen, dirs_seen)
+    
+    def _check_directory(self) -> dict:
+        """Walk and validate the media directory, reusing the result if it is unchanged."""
+        directory = Path(self.media_directory)
+        
+        # A directory's mtime changes whenever entries are added or removed
+        try:
+            cache_key = (str(directory), os.stat(directory).st_mtime_ns, self.sample_limit)
+        except OSError:
+            cache_key = None
+        
+        with self.dir_stat_lock:
+            cached = self.dir_stat_cache.get(cache_key) if cache_key else None
+            if cached:
+                self.dir_stat_cache.move_to_end(cache_key)
+        if cached:
+            self.sampled = cached['sampled']
+            return cached['validation']
+        
+        from core.scanner import get_shared_scanner
+        
+        scanner = get_shared_scanner()
+        validation = scanner.validate_directory_fast(directory, self._iter_entries(str(directory)))
+        
+        if cache_key and validation['valid'] and not self._is_cancelled():
+            with self.dir_stat_lock:
+                self.dir_stat_cache[cache_key] = {'validation': validation, 'sampled': self.sampled}
+                while len(self.dir_stat_cache) > _DIR_STAT_CACHE_SIZE:
+                    self.dir_stat_cache.popitem(last=False)
+        
+        return validation
+    
+    def _check_tmdb_key(self) -> bool:
+        """Validate the TMDB API key, reusing a recent result or a client per key."""
+        from api.http_session import get_shared_session
+        from api.tmdb_client import TMDBClient
+        
+        def probe() -> bool:
+            tmdb_client = self.tmdb_clients.get(self.tmdb_api_key)
+            if tmdb_client is None:
+                tmdb_client = self.tmdb_clients.setdefault(
+                    self.tmdb_api_key, TMDBClient(self.tmdb_api_key, session=get_shared_session())
+                )
+            return tmdb_client.test_api_key()
+        
+        return _cached_key_check('TMDB', self.tmdb_api_key, probe)
+    
+    def _check_anilist_key(self) -> bool:
+        """Validate the AniList API key, reusing a recent result."""
+        from api.anilist_client import AniListClient
+        from api.http_session import get_shared_session
+        
+        def probe() -> bool:
+            return AniListClient(self.anilist_api_key, session=get_shared_session()).test_api_key()
+        
+        return _cached_key_check('AniList', self.anilist_api_key, probe)
     
     def run(self):
         """Run validation in background."""
+        if self._is_cancelled():
+            # Cancelled while it was still queued
+            return
+        
         result = {
             'directory_valid': False,
-            'tmdb_api_key_valid': False,
-            'anilist_api_key_valid': False,
+            'tmdb_api_key_valid': True,  # Optional
+            'anilist_api_key_valid': True,  # Optional
             'directory_stats': {},
+            'sampled': False,
             'error_message': ''
         }
         
-        try:
-            # Validate directory
-            if self.media_directory:
-                scanner = MediaScanner()
-                validation = scanner.validate_directory(Path(self.media_directory))
-                result['directory_valid'] = validation['valid']
-                if validation['valid']:
-                    result['directory_stats'] = validation.get('stats', {})
-                else:
-                    result['error_message'] = validation.get('error', 'Unknown error')
-            
-            # Validate TMDB API key
-            if self.tmdb_api_key:
-                tmdb_client = TMDBClient(self.tmdb_api_key)
-                result['tmdb_api_key_valid'] = tmdb_client.test_api_key()
-            else:
-                result['tmdb_api_key_valid'] = True  # Optional
-            
-            # Validate AniList API key
-            if self.anilist_api_key:
-                from api.anilist_client import AniListClient
-                anilist_client = AniListClient(self.anilist_api_key)
-                result['anilist_api_key_valid'] = anilist_client.test_api_key()
-            else:
-                result['anilist_api_key_valid'] = True  # Optional
+        # A missing or unreadable directory fails validation on its own, so
+        # report it without spending network round-trips on the API keys
+        if self.media_directory:
+            from core.scanner import get_shared_scanner
             
+            try:
+                access_error = get_shared_scanner().check_directory_access(Path(self.media_directory))
+            except Exception as e:
+                access_error = f"Directory check failed: {e}"
+                logger.error(f"Directory check error: {e}")
+            if access_error:
+                result['error_message'] = access_error
+                if not self._is_cancelled():
+                    self.signals.validation_complete.emit(self.job_id, result)
+                return
+        
+        # The directory walk is disk-bound and the key checks are network-bound,
+        # so run all of them side by side
+        checks = []
+        if self.media_directory:
+            checks.append(('directory', "Directory check", self._check_directory))
+        if self.tmdb_api_key:
+            checks.append(('tmdb', "TMDB check", self._check_tmdb_key))
+        if self.anilist_api_key:
+            checks.append(('anilist', "AniList check", self._check_anilist_key))
+        
+        outcomes = {}
+        failures = {}
+        try:
+            with ThreadPoolExecutor(max_workers=max(len(checks), 1)) as executor:
+                futures = {executor.submit(check): (name, label) for name, label, check in checks}
+                for future in as_completed(futures):
+                    name, label = futures[future]
+                    try:
+                        outcomes[name] = future.result()
+                    except Exception as e:
+                        failures[name] = f"{label} failed: {e}"
+                        logger.error(f"{label} error: {e}")
         except Exception as e:
-            result['error_message'] = str(e)
+            failures['worker'] = str(e)
             logger.error(f"Validation error: {e}")
         
-        self.validation_complete.emit(result)
+        errors = []
+        validation = outcomes.get('directory')
+        if validation:
+            result['directory_valid'] = validation['valid']
+            if validation['valid']:
+                result['directory_stats'] = validation.get('stats', {})
+                result['sampled'] = self.sampled
+            else:
+                errors.append(validation.get('error', 'Unknown error'))
+        if self.tmdb_api_key:
+            result['tmdb_api_key_valid'] = bool(outcomes.get('tmdb'))
+        if self.anilist_api_key:
+            result['anilist_api_key_valid'] = bool(outcomes.get('anilist'))
+        
+        # Report failures in a stable order regardless of completion order
+        errors.extend(failures[name] for name in ('directory', 'tmdb', 'anilist', 'worker') if name in failures)
+        
+        if self._is_cancelled():
+            logger.debug("Validation cancelled, discarding result")
+            return
+        
+        result['error_message'] = "; ".join(errors)
+        self.signals.validation_complete.emit(self.job_id, result)
+
+
+class SettingsSaveSignals(QObject):
+    """Signals emitted by SettingsSaveRunnable."""
+    
+    save_failed = Signal(str)
+
+
+class SettingsSaveRunnable(QRunnable):
+    """Runnable that writes settings to disk off the UI thread."""
+    
+    def __init__(self, settings: AppSettings):
+        super().__init__()
+        self.settings = settings
+        self.signals = SettingsSaveSignals()
+    
+    def run(self):
+        """Save the settings in background."""
+        try:
+            self.settings.save()
+            logger.info("Settings saved successfully")
+        except Exception as e:
+            logger.error(f"Failed to save settings: {e}")
+            self.signals.save_failed.emit(str(e))
 
 
 class SetupDialog(QDialog):
     """Initial setup dialog for configuring the application."""
     
-    def __init__(self, parent=None):
+    # Delay before reacting to edits, so typing only updates the label once
+    SETTINGS_CHANGED_DELAY_MS = 150
+    
+    # Lines reserved for validation_label, enough for the full success message
+    VALIDATION_LABEL_LINES = 12
+    
+    # validation_label stylesheet per state; applied only when the state changes
+    VALIDATION_STYLES = {
+        'idle': "margin: 10px; font-style: italic;",
+        'dirty': "margin: 10px; font-style: italic; color: #666;",
+        'ok': "margin: 10px; color: green;",
+        'err': "margin: 10px; color: red;",
+    }
+    
+    def __init__(self, parent=None, settings: Optional[AppSettings] = None):
         super().__init__(parent)
         self.setWindowTitle("Media Folder Icon Manager - Setup")
         self.setModal(True)
-        self.setMinimumSize(600, 500)
+        self.setMinimumWidth(600)
+        self.resize(600, 500)
         
-        self.settings = AppSettings()
-        self.validation_worker = None
+        # Callers that already loaded the settings pass them in to skip a second read
+        if settings is not None:
+            # Edit a copy, so the caller's settings are untouched if setup is cancelled
+            self.settings = settings.copy(deep=True)
+        else:
+            try:
+                self.settings = _cached_settings_load()
+            except (OSError, ValueError) as e:
+                logger.debug(f"Failed to load existing settings: {e}")
+                self.settings = AppSettings()
+        self.validation_runnable = None
+        self._validation_job_id = 0
+        self.save_runnable = None
+        self._validation_state = None
+        
+        # Widgets on lazily built tabs stay None until the tab is first opened
+        self.api_key_edit = None
+        self.anilist_api_key_edit = None
+        self.tv_shows_check = None
+        self.movies_check = None
+        self.anime_check = None
+        self._tmdb_clients: Dict[str, "TMDBClient"] = {}
+        self._dir_stat_cache: "OrderedDict[Tuple[str, int, int], dict]" = OrderedDict()
+        self._dir_stat_lock = threading.Lock()
+        
+        self._change_timer = QTimer(self)
+        self._change_timer.setSingleShot(True)
+        self._change_timer.setInterval(self.SETTINGS_CHANGED_DELAY_MS)
+        self._change_timer.timeout.connect(self._apply_settings_changed)
         
         self._init_ui()
         self._connect_signals()
@@ -94,13 +455,17 @@ class SetupDialog(QDialog):
     
     def _init_ui(self):
         """Initialize the user interface."""
-        layout = QVBoxLayout(self)
+        # One flat grid for the whole dialog: header, tabs, status and a button row.
+        # Column 1 is an empty stretch column that pushes Cancel/OK to the right.
+        layout = QGridLayout(self)
+        layout.setRowStretch(2, 1)
+        layout.setColumnStretch(1, 1)
         
         # Title
         title = QLabel("Welcome to Media Folder Icon Manager")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; margin: 10px;")
+        title.setStyleSheet(_STYLE_TITLE)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(title)
+        layout.addWidget(title, 0, 0, 1, 4)
         
         # Description
         description = QLabel(
@@ -108,46 +473,45 @@ class SetupDialog(QDialog):
             "and embeds poster thumbnails in movie files. Please configure the settings below."
         )
         description.setWordWrap(True)
-        description.setStyleSheet("margin: 10px; color: #666;")
-        layout.addWidget(description)
+        description.setStyleSheet(_STYLE_DESCRIPTION)
+        layout.addWidget(description, 1, 0, 1, 4)
         
         # Tabs
         self.tab_widget = QTabWidget()
-        layout.addWidget(self.tab_widget)
+        layout.addWidget(self.tab_widget, 2, 0, 1, 4)
         
         # Basic settings tab
         self._create_basic_tab()
         
-        # API settings tab
-        self._create_api_tab()
-        
-        # Features tab
-        self._create_features_tab()
+        # API and features tabs are only built when first opened
+        self._lazy_tabs = {}
+        self._add_lazy_tab("API Keys", self._create_api_tab_content)
+        self._add_lazy_tab("Features", self._create_features_tab_content)
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
         
         # Validation status
         self.validation_label = QLabel("Click 'Validate Settings' to check configuration")
-        self.validation_label.setStyleSheet("margin: 10px; font-style: italic;")
-        layout.addWidget(self.validation_label)
+        self._set_validation_state('idle')
+        # Reserve room for the multi-line result up front, so swapping between the
+        # one-line progress text and the result doesn't resize the whole grid
+        # (an explicit minimum replaces the label's own, so it must fit the longest message)
+        line_height = self.validation_label.fontMetrics().lineSpacing()
+        self.validation_label.setMinimumHeight(line_height * self.VALIDATION_LABEL_LINES + 20)
+        layout.addWidget(self.validation_label, 3, 0, 1, 4)
         
         # Buttons
-        button_layout = QHBoxLayout()
-        
         self.validate_button = QPushButton("Validate Settings")
         self.validate_button.clicked.connect(self._validate_settings)
-        button_layout.addWidget(self.validate_button)
-        
-        button_layout.addStretch()
+        layout.addWidget(self.validate_button, 4, 0)
         
         self.cancel_button = QPushButton("Cancel")
         self.cancel_button.clicked.connect(self.reject)
-        button_layout.addWidget(self.cancel_button)
+        layout.addWidget(self.cancel_button, 4, 2)
         
         self.ok_button = QPushButton("OK")
         self.ok_button.clicked.connect(self._save_and_accept)
         self.ok_button.setEnabled(False)
-        button_layout.addWidget(self.ok_button)
-        
-        layout.addLayout(button_layout)
+        layout.addWidget(self.ok_button, 4, 3)
     
     def _create_basic_tab(self):
         """Create the basic settings tab."""
@@ -183,15 +547,35 @@ class SetupDialog(QDialog):
         self.tray_mode_check = QCheckBox("Start in system tray")
         self.tray_mode_check.setChecked(True)
         
+        self.full_scan_check = QCheckBox("Count every file when validating (slower on large libraries)")
+        self.full_scan_check.setChecked(False)
+        
         scan_layout.addRow("Scan Frequency:", self.frequency_spin)
         scan_layout.addRow("Tray Mode:", self.tray_mode_check)
+        scan_layout.addRow("Full Scan:", self.full_scan_check)
         layout.addWidget(scan_group)
         
         layout.addStretch()
         self.tab_widget.addTab(tab, "Basic")
     
-    def _create_api_tab(self):
-        """Create the API settings tab."""
+    def _add_lazy_tab(self, title: str, builder):
+        """Add a placeholder tab whose content is built by builder on first view."""
+        placeholder = QWidget()
+        placeholder_layout = QVBoxLayout(placeholder)
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+        index = self.tab_widget.addTab(placeholder, title)
+        self._lazy_tabs[index] = builder
+    
+    def _materialize_tab(self, index: int):
+        """Build the real content of a lazy tab the first time it is shown."""
+        builder = self._lazy_tabs.pop(index, None)
+        if builder is None:
+            return
+        
+        self.tab_widget.widget(index).layout().addWidget(builder())
+    
+    def _create_api_tab_content(self) -> QWidget:
+        """Create the API settings tab content."""
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
@@ -199,17 +583,11 @@ class SetupDialog(QDialog):
         tmdb_group = QGroupBox("TMDB API Configuration")
         tmdb_layout = QVBoxLayout(tmdb_group)
         
-        info_text = QTextEdit()
-        info_text.setMaximumHeight(100)
-        info_text.setReadOnly(True)
-        info_text.setHtml("""
-        <p>To use this application optimally, you can configure API keys for enhanced features:</p>
-        <ul>
-        <li><strong>TMDB:</strong> Required for movie and TV show metadata</li>
-        <li><strong>AniList:</strong> Optional for enhanced anime features (public API works without key)</li>
-        </ul>
-        """)
-        tmdb_layout.addWidget(info_text)
+        info_label = QLabel(_API_INFO_HTML)
+        info_label.setTextFormat(Qt.TextFormat.RichText)
+        info_label.setWordWrap(True)
+        info_label.setOpenExternalLinks(True)
+        tmdb_layout.addWidget(info_label)
         
         # TMDB API Key section
         tmdb_form = QFormLayout()
@@ -224,13 +602,10 @@ class SetupDialog(QDialog):
         tmdb_form.addRow("", show_key_check)
         
         # Add TMDB instructions
-        tmdb_instructions = QTextEdit()
-        tmdb_instructions.setMaximumHeight(80)
-        tmdb_instructions.setReadOnly(True)
-        tmdb_instructions.setHtml("""
-        <small>Get your free TMDB API key from: 
-        <a href="https://www.themoviedb.org/settings/api">https://www.themoviedb.org/settings/api</a></small>
-        """)
+        tmdb_instructions = QLabel(_TMDB_INSTRUCTIONS_HTML)
+        tmdb_instructions.setTextFormat(Qt.TextFormat.RichText)
+        tmdb_instructions.setWordWrap(True)
+        tmdb_instructions.setOpenExternalLinks(True)
         tmdb_form.addRow("", tmdb_instructions)
         
         tmdb_layout.addLayout(tmdb_form)
@@ -251,13 +626,10 @@ class SetupDialog(QDialog):
         anilist_form.addRow("", show_anilist_key_check)
         
         # Add AniList instructions
-        anilist_instructions = QTextEdit()
-        anilist_instructions.setMaximumHeight(80)
-        anilist_instructions.setReadOnly(True)
-        anilist_instructions.setHtml("""
-        <small>AniList API key is optional. The app works with public API, but authenticated requests provide more features. 
-        Get your key from: <a href="https://anilist.co/settings/developer">https://anilist.co/settings/developer</a></small>
-        """)
+        anilist_instructions = QLabel(_ANILIST_INSTRUCTIONS_HTML)
+        anilist_instructions.setTextFormat(Qt.TextFormat.RichText)
+        anilist_instructions.setWordWrap(True)
+        anilist_instructions.setOpenExternalLinks(True)
         anilist_form.addRow("", anilist_instructions)
         
         anilist_layout.addLayout(anilist_form)
@@ -265,10 +637,17 @@ class SetupDialog(QDialog):
         layout.addWidget(tmdb_group)
         
         layout.addStretch()
-        self.tab_widget.addTab(tab, "API Keys")
+        
+        # Populate from settings before connecting, so loading isn't seen as an edit
+        self.api_key_edit.setText(self.settings.api_keys.tmdb or "")
+        self.anilist_api_key_edit.setText(self.settings.api_keys.anilist or "")
+        self.api_key_edit.textChanged.connect(self._on_settings_changed)
+        self.anilist_api_key_edit.textChanged.connect(self._on_settings_changed)
+        
+        return tab
     
-    def _create_features_tab(self):
-        """Create the features tab."""
+    def _create_features_tab_content(self) -> QWidget:
+        """Create the features tab content."""
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
@@ -277,13 +656,13 @@ class SetupDialog(QDialog):
         features_layout = QVBoxLayout(features_group)
         
         self.tv_shows_check = QCheckBox("Set folder icons for TV Shows")
-        self.tv_shows_check.setChecked(True)
+        self.tv_shows_check.setChecked(self.settings.features.tv_shows)
         
         self.movies_check = QCheckBox("Embed thumbnails in Movie files")
-        self.movies_check.setChecked(True)
+        self.movies_check.setChecked(self.settings.features.movies)
         
         self.anime_check = QCheckBox("Set folder icons for Anime (requires internet)")
-        self.anime_check.setChecked(True)
+        self.anime_check.setChecked(self.settings.features.anime)
         
         features_layout.addWidget(self.tv_shows_check)
         features_layout.addWidget(self.movies_check)
@@ -295,16 +674,7 @@ class SetupDialog(QDialog):
         req_group = QGroupBox("Requirements")
         req_layout = QVBoxLayout(req_group)
         
-        req_text = QLabel("""
-        <b>For movie thumbnail embedding:</b><br>
-        • FFmpeg executable must be placed in the assets/ffmpeg/ folder<br>
-        • Download from: <a href="https://ffmpeg.org/download.html">https://ffmpeg.org/download.html</a><br><br>
-        
-        <b>Supported video formats:</b><br>
-        • MP4, MKV, AVI, MOV, WMV, and others<br><br>
-        
-        <b>Note:</b> Icon creation requires write permissions to your media folders.
-        """)
+        req_text = QLabel(_REQUIREMENTS_HTML)
         req_text.setWordWrap(True)
         req_text.setOpenExternalLinks(True)
         req_layout.addWidget(req_text)
@@ -312,13 +682,11 @@ class SetupDialog(QDialog):
         layout.addWidget(req_group)
         
         layout.addStretch()
-        self.tab_widget.addTab(tab, "Features")
+        return tab
     
     def _connect_signals(self):
         """Connect UI signals."""
         self.directory_edit.textChanged.connect(self._on_settings_changed)
-        self.api_key_edit.textChanged.connect(self._on_settings_changed)
-        self.anilist_api_key_edit.textChanged.connect(self._on_settings_changed)
         self.frequency_spin.valueChanged.connect(self._on_settings_changed)
     
     def _browse_directory(self):
@@ -331,6 +699,18 @@ class SetupDialog(QDialog):
         if directory:
             self.directory_edit.setText(directory)
     
+    def _tmdb_api_key(self) -> str:
+        """Get the TMDB API key from the form, or from settings if the API tab was never opened."""
+        if self.api_key_edit is None:
+            return (self.settings.api_keys.tmdb or "").strip()
+        return self.api_key_edit.text().strip()
+    
+    def _anilist_api_key(self) -> str:
+        """Get the AniList API key from the form, or from settings if the API tab was never opened."""
+        if self.anilist_api_key_edit is None:
+            return (self.settings.api_keys.anilist or "").strip()
+        return self.anilist_api_key_edit.text().strip()
+    
     def _toggle_api_key_visibility(self, show: bool):
         """Toggle TMDB API key visibility."""
         self.api_key_edit.setEchoMode(QLineEdit.EchoMode.Normal if show else QLineEdit.EchoMode.Password)
@@ -339,121 +719,175 @@ class SetupDialog(QDialog):
         """Toggle AniList API key visibility."""
         self.anilist_api_key_edit.setEchoMode(QLineEdit.EchoMode.Normal if show else QLineEdit.EchoMode.Password)
     
+    def _set_validation_state(self, state: str):
+        """Style validation_label for a state, skipping the stylesheet reparse when it is unchanged."""
+        if state == self._validation_state:
+            return
+        self._validation_state = state
+        self.validation_label.setStyleSheet(self.VALIDATION_STYLES[state])
+    
     def _on_settings_changed(self):
         """Handle settings change."""
+        # Disable OK right away so stale validation can't be accepted,
+        # but defer the label update until editing pauses
         self.ok_button.setEnabled(False)
+        self._change_timer.start()
+    
+    def _apply_settings_changed(self):
+        """Show that settings need to be validated again."""
         self.validation_label.setText("Settings changed. Click 'Validate Settings' to verify.")
-        self.validation_label.setStyleSheet("margin: 10px; font-style: italic; color: #666;")
+        self._set_validation_state('dirty')
     
     def _validate_settings(self):
         """Validate the current settings."""
         directory = self.directory_edit.text().strip()
-        api_key = self.api_key_edit.text().strip()
-        anilist_api_key = self.anilist_api_key_edit.text().strip()
+        api_key = self._tmdb_api_key()
+        anilist_api_key = self._anilist_api_key()
         
         if not directory:
             QMessageBox.warning(self, "Validation Error", "Please select a media directory.")
             return
         
+        # A pending "settings changed" update must not overwrite the new result
+        self._change_timer.stop()
+        
         # Start validation in background
         self.validate_button.setEnabled(False)
         self.validate_button.setText("Validating...")
         
-        self.validation_worker = ValidationWorker(directory, api_key, anilist_api_key)
-        self.validation_worker.validation_complete.connect(self._on_validation_complete)
-        self.validation_worker.start()
+        self._cancel_validation()
+        
+        sample_limit = 0 if self.full_scan_check.isChecked() else _VALIDATION_SAMPLE_LIMIT
+        self._validation_job_id += 1
+        self.validation_runnable = ValidationRunnable(
+            self._validation_job_id, directory, api_key, anilist_api_key, sample_limit,
+            self._tmdb_clients, self._dir_stat_cache, self._dir_stat_lock
+        )
+        self.validation_runnable.signals.validation_complete.connect(self._on_validation_complete)
+        self.validation_runnable.signals.progress.connect(self._on_validation_progress)
+        QThreadPool.globalInstance().start(self.validation_runnable)
+    
+    def _cancel_validation(self):
+        """Cancel an in-flight validation so scans don't pile up on the same disk."""
+        if self.validation_runnable is not None:
+            # Signals it had already queued are dropped by their job id
+            self.validation_runnable.cancel()
+            self.validation_runnable = None
+    
+    def done(self, result):
+        """Stop any running validation when the dialog is accepted, rejected or closed."""
+        self._cancel_validation()
+        super().done(result)
+    
+    def _on_validation_progress(self, job_id: int, files_seen: int, dirs_seen: int):
+        """Show how far the directory scan has got."""
+        if job_id != self._validation_job_id:
+            return
+        self.validation_label.setText(f"Scanning: {files_seen} files, {dirs_seen} folders…")
+        self._set_validation_state('idle')
     
-    def _on_validation_complete(self, result):
+    def _on_validation_complete(self, job_id: int, result: dict):
         """Handle validation completion."""
+        if job_id != self._validation_job_id:
+            return
+        
         self.validate_button.setEnabled(True)
         self.validate_button.setText("Validate Settings")
         
         if result['directory_valid']:
             # Success - directory is valid
             stats = result.get('directory_stats', {})
-            message = "✅ Validation successful!\n\n"
-            message += f"Directory: {self.directory_edit.text()}\n"
-            message += f"• Video files: {stats.get('video_files', 0)}\n"
-            message += f"• TV show folders: {stats.get('tv_folders', 0)}\n"
-            message += f"• Total folders: {stats.get('total_folders', 0)}\n\n"
+            # A sampled walk stops early, so its counts are lower bounds
+            approx = "at least " if result.get('sampled') else ""
+            parts = [
+                "✅ Validation successful!\n\n",
+                f"Directory: {self.directory_edit.text()}\n",
+                f"• Video files: {approx}{stats.get('video_files', 0)}\n",
+                f"• TV show folders: {approx}{stats.get('tv_folders', 0)}\n",
+                f"• Total folders: {approx}{stats.get('total_folders', 0)}\n",
+            ]
+            if result.get('sampled'):
+                parts.append("  (sampled scan - enable 'Full Scan' for exact counts)\n")
+            parts.append("\n")
             
             # Add API key validation results
             if result['tmdb_api_key_valid']:
-                message += "✅ TMDB API key: Valid\n"
-            elif self.api_key_edit.text().strip():
-                message += "❌ TMDB API key: Invalid\n"
+                parts.append("✅ TMDB API key: Valid\n")
+            elif self._tmdb_api_key():
+                parts.append("❌ TMDB API key: Invalid\n")
             else:
-                message += "⚠️ TMDB API key: Not provided (some features will be limited)\n"
+                parts.append("⚠️ TMDB API key: Not provided (some features will be limited)\n")
             
             if result['anilist_api_key_valid']:
-                message += "✅ AniList API key: Valid\n"
-            elif self.anilist_api_key_edit.text().strip():
-                message += "❌ AniList API key: Invalid\n"
+                parts.append("✅ AniList API key: Valid\n")
+            elif self._anilist_api_key():
+                parts.append("❌ AniList API key: Invalid\n")
             else:
-                message += "✅ AniList API key: Not required (using public API)\n"
+                parts.append("✅ AniList API key: Not required (using public API)\n")
             
-            self.validation_label.setText(message)
-            self.validation_label.setStyleSheet("margin: 10px; color: green;")
+            self.validation_label.setText(''.join(parts))
+            self._set_validation_state('ok')
             self.ok_button.setEnabled(True)
             
         else:
             # Failure
-            errors = []
-            if not result['directory_valid']:
-                errors.append(f"Directory: {result.get('error_message', 'Invalid directory')}")
-            if not result['tmdb_api_key_valid'] and self.api_key_edit.text().strip():
-                errors.append("TMDB API Key: Invalid or expired")
-            if not result['anilist_api_key_valid'] and self.anilist_api_key_edit.text().strip():
-                errors.append("AniList API Key: Invalid or expired")
+            checks = (
+                (not result['directory_valid'],
+                 f"Directory: {result.get('error_message', 'Invalid directory')}"),
+                (not result['tmdb_api_key_valid'] and self._tmdb_api_key(),
+                 "TMDB API Key: Invalid or expired"),
+                (not result['anilist_api_key_valid'] and self._anilist_api_key(),
+                 "AniList API Key: Invalid or expired"),
+            )
             
-            message = f"❌ Validation failed:\n" + "\n".join(f"• {error}" for error in errors)
+            message = "❌ Validation failed:\n" + "\n".join(f"• {error}" for failed, error in checks if failed)
             self.validation_label.setText(message)
-            self.validation_label.setStyleSheet("margin: 10px; color: red;")
+            self._set_validation_state('err')
             self.ok_button.setEnabled(False)
     
     def _save_and_accept(self):
-        """Save settings and accept dialog."""
-        try:            # Update settings
-            self.settings.media_directory = self.directory_edit.text().strip()
-            self.settings.scan_frequency = self.frequency_spin.value()
-            self.settings.tray_mode = self.tray_mode_check.isChecked()
-            self.settings.api_keys.tmdb = self.api_key_edit.text().strip()
-            self.settings.api_keys.anilist = self.anilist_api_key_edit.text().strip()
-            
-            # Update features
+        """Save settings in the background and accept dialog."""
+        previous_state = self.settings.dict()
+        
+        # Update settings
+        self.settings.media_directory = self.directory_edit.text().strip()
+        self.settings.scan_frequency = self.frequency_spin.value()
+        self.settings.tray_mode = self.tray_mode_check.isChecked()
+        self.settings.api_keys.tmdb = self._tmdb_api_key()
+        self.settings.api_keys.anilist = self._anilist_api_key()
+        
+        # Update features (unchanged if the tab was never opened)
+        if self.tv_shows_check is not None:
             self.settings.features.tv_shows = self.tv_shows_check.isChecked()
             self.settings.features.movies = self.movies_check.isChecked()
             self.settings.features.anime = self.anime_check.isChecked()
-            
-            # Save settings
-            self.settings.save()
-            
-            logger.info("Settings saved successfully")
+        
+        # Nothing to write if the form matches what is already on disk
+        if self.settings.dict() == previous_state and AppSettings.exists():
+            logger.debug("Settings unchanged, skipping save")
             self.accept()
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save settings: {e}")
-            logger.error(f"Failed to save settings: {e}")
+            return
+        
+        # Write a snapshot to disk off the UI thread; failures are reported back
+        self.save_runnable = SettingsSaveRunnable(self.settings.copy(deep=True))
+        self.save_runnable.signals.save_failed.connect(self._on_save_failed)
+        QThreadPool.globalInstance().start(self.save_runnable)
+        
+        self.accept()
+    
+    def _on_save_failed(self, error_message: str):
+        """Handle a failed background settings save."""
+        QMessageBox.critical(self, "Error", f"Failed to save settings: {error_message}")
     
     def _load_existing_settings(self):
-        """Load existing settings if available."""
-        try:
-            existing_settings = AppSettings.load()
-            
-            if existing_settings.media_directory:
-                self.directory_edit.setText(existing_settings.media_directory)
-              if existing_settings.api_keys.tmdb:
-                self.api_key_edit.setText(existing_settings.api_keys.tmdb)
-            
-            if existing_settings.api_keys.anilist:
-                self.anilist_api_key_edit.setText(existing_settings.api_keys.anilist)
-            
-            self.frequency_spin.setValue(existing_settings.scan_frequency)
-            self.tray_mode_check.setChecked(existing_settings.tray_mode)
-            
-            self.tv_shows_check.setChecked(existing_settings.features.tv_shows)
-            self.movies_check.setChecked(existing_settings.features.movies)
-            self.anime_check.setChecked(existing_settings.features.anime)
+        """Populate the basic tab from the loaded settings; lazy tabs populate themselves."""
+        if not AppSettings.exists():
+            return
+        
+        # Loading values is not an edit, so don't let it reach _on_settings_changed
+        with QSignalBlocker(self.directory_edit), QSignalBlocker(self.frequency_spin):
+            if self.settings.media_directory:
+                self.directory_edit.setText(self.settings.media_directory)
             
-        except Exception as e:
-            logger.debug(f"No existing settings to load: {e}")
+            self.frequency_spin.setValue(self.settings.scan_frequency)
+            self.tray_mode_check.setChecked(self.settings.tray_mode)
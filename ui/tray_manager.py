@@ -2,26 +2,80 @@
 System tray management for running the application in the background.
 """
 
+import base64
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-import pystray
-from PIL import Image, ImageDraw
 from PySide6.QtWidgets import QSystemTrayIcon, QMenu, QApplication
-from PySide6.QtCore import QObject, Signal, QTimer
+from PySide6.QtCore import Qt, QObject, Signal, QTimer
 from PySide6.QtGui import QIcon, QPixmap, QAction
 
 from config.settings import AppSettings
+from utils.logger import remove_gui_logging
 
 
 logger = logging.getLogger(__name__)
 
+# Fallback tray icon (64x64 folder with an "F"), pre-rendered so startup doesn't need PIL
+_DEFAULT_TRAY_ICON_PNG = base64.b64decode(
+    b"iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAA3klEQVR42u3aMQrCMBiG4a8h"
+    b"o6CTuNYLKC52dHH3Am5O3T2Fm4ODp/AYdfEI3kEQQdTq1tGWim3gf98tEAg8JP/SSkRERERE"
+    b"ZLGobEO2m7x/PSRJT1GoAL7KpmkyrH3AMTsHfQOc9SfgmAENzIC2+zaD/j4D2q5sBjEDAAAA"
+    b"AAAAAMBuvolD0n1Xcf9VrMfxQ/PR3Q6Ad9J6ceUJAGB1BjxzaXPoFOvl7KZBL2cG8AQAMAKw"
+    b"XV24AQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhVOnDSOi/uxIREVGtPn70ITUmMow0AAAA"
+    b"AElFTkSuQmCC"
+)
+
+# Format of the next scan time shown in the status tooltip
+_NEXT_SCAN_FORMAT = "%H:%M %d/%m"
+
+# Rich text for the About box
+_ABOUT_HTML = """
+<h3>Media Folder Icon Manager</h3>
+<p>Automatically sets folder icons for TV shows and anime,<br>
+and embeds poster thumbnails in movie files.</p>
+
+<p><b>Features:</b></p>
+<ul>
+<li>Automatic media directory scanning</li>
+<li>Custom folder icons for TV shows and anime</li>
+<li>Poster thumbnail embedding in movies</li>
+<li>Background operation with system tray</li>
+</ul>
+
+<p><b>APIs Used:</b></p>
+<ul>
+<li>TMDB (The Movie Database)</li>
+<li>AniList (for anime detection)</li>
+</ul>
+"""
+
+
+@lru_cache(maxsize=None)
+def _find_tray_icon_path() -> Optional[Path]:
+    """Locate the tray icon file once per process."""
+    project_root = Path(__file__).parent.parent
+    icons_dir = project_root / "assets" / "icons"
+    
+    # Look for icon files
+    for name in ["tray_icon.png", "app_icon.png", "icon.png"]:
+        icon_path = icons_dir / name
+        if icon_path.is_file():
+            return icon_path
+    
+    return None
+
 
 class TrayManager(QObject):
     """Manages system tray functionality."""
-      # Signals
+    
+    # Fallback icon, decoded once per process
+    _DEFAULT_ICON: Optional[QIcon] = None
+    
+    # Signals
     show_main_window = Signal()
     start_scan = Signal()
     quit_application = Signal()
@@ -33,6 +87,10 @@ class TrayManager(QObject):
         self.tray_icon = None
         self.tray_menu = None
         
+        # Last status tooltip and the next-scan time it was built from
+        self._status_tooltip = None
+        self._status_next_scan_epoch = None
+        
         # Check if system tray is available
         if not QSystemTrayIcon.isSystemTrayAvailable():
             logger.warning("System tray is not available")
@@ -48,7 +106,7 @@ class TrayManager(QObject):
             
             # Set icon
             icon_path = self._get_tray_icon_path()
-            if icon_path and icon_path.exists():
+            if icon_path:
                 icon = QIcon(str(icon_path))
             else:
                 # Create a default icon if none exists
@@ -68,41 +126,20 @@ class TrayManager(QObject):
     
     def _get_tray_icon_path(self) -> Optional[Path]:
         """Get the path to the tray icon."""
-        project_root = Path(__file__).parent.parent
-        icons_dir = project_root / "assets" / "icons"
-        
-        # Look for icon files
-        for name in ["tray_icon.png", "app_icon.png", "icon.png"]:
-            icon_path = icons_dir / name
-            if icon_path.exists():
-                return icon_path
-        
-        return None
+        return _find_tray_icon_path()
     
     def _create_default_icon(self) -> QIcon:
         """Create a default tray icon."""
+        if TrayManager._DEFAULT_ICON is not None:
+            return TrayManager._DEFAULT_ICON
+        
         try:
-            # Create a simple icon using PIL
-            size = 64
-            image = Image.new('RGBA', (size, size), color=(0, 0, 0, 0))
-            draw = ImageDraw.Draw(image)
-            
-            # Draw a simple folder icon
-            # Background
-            draw.rectangle([8, 16, size-8, size-8], fill=(255, 206, 84), outline=(200, 150, 50))
-            # Tab
-            draw.rectangle([8, 12, 24, 16], fill=(255, 206, 84), outline=(200, 150, 50))
-            # F letter
-            draw.text((size//2-8, size//2-8), "F", fill=(100, 100, 100))
-            
-            # Convert PIL image to QIcon
-            import io
-            buffer = io.BytesIO()
-            image.save(buffer, format='PNG')
             pixmap = QPixmap()
-            pixmap.loadFromData(buffer.getvalue())
+            if not pixmap.loadFromData(_DEFAULT_TRAY_ICON_PNG, "PNG"):
+                raise ValueError("embedded icon could not be decoded")
             
-            return QIcon(pixmap)
+            TrayManager._DEFAULT_ICON = QIcon(pixmap)
+            return TrayManager._DEFAULT_ICON
             
         except Exception as e:
             logger.error(f"Failed to create default icon: {e}")
@@ -147,12 +184,16 @@ class TrayManager(QObject):
     
     def _connect_signals(self):
         """Connect internal signals."""
-        self.show_main_window.connect(self.main_window.show)
-        self.show_main_window.connect(self.main_window.raise_)
-        self.show_main_window.connect(self.main_window.activateWindow)
+        self.show_main_window.connect(self._show_and_raise, Qt.DirectConnection)
         
         self.quit_application.connect(self._on_quit_application)
     
+    def _show_and_raise(self):
+        """Show, raise and focus the main window in a single slot call."""
+        self.main_window.show()
+        self.main_window.raise_()
+        self.main_window.activateWindow()
+    
     def _on_tray_activated(self, reason):
         """Handle tray icon activation."""
         if reason == QSystemTrayIcon.DoubleClick:
@@ -187,27 +228,7 @@ class TrayManager(QObject):
         """Show about dialog."""
         from PySide6.QtWidgets import QMessageBox
         
-        about_text = """
-        <h3>Media Folder Icon Manager</h3>
-        <p>Automatically sets folder icons for TV shows and anime,<br>
-        and embeds poster thumbnails in movie files.</p>
-        
-        <p><b>Features:</b></p>
-        <ul>
-        <li>Automatic media directory scanning</li>
-        <li>Custom folder icons for TV shows and anime</li>
-        <li>Poster thumbnail embedding in movies</li>
-        <li>Background operation with system tray</li>
-        </ul>
-        
-        <p><b>APIs Used:</b></p>
-        <ul>
-        <li>TMDB (The Movie Database)</li>
-        <li>AniList (for anime detection)</li>
-        </ul>
-        """
-        
-        QMessageBox.about(None, "About", about_text)
+        QMessageBox.about(None, "About", _ABOUT_HTML)
     
     def _quit_application(self):
         """Quit the application."""
@@ -218,21 +239,29 @@ class TrayManager(QObject):
         """Handle quit application signal."""
         if self.tray_icon:
             self.tray_icon.hide()
+        # Flush queued log records and stop the GUI log timer before the event loop ends
+        remove_gui_logging()
         QApplication.quit()
     
     def _show_status_message(self):
         """Show current status in a tooltip."""
         try:
             # Get scan status
-            next_scan = "Not scheduled"
+            next_scan_time = None
             if hasattr(self.main_window, 'scheduler'):
                 next_scan_time = self.main_window.scheduler.get_next_scan_time()
-                if next_scan_time:
-                    next_scan = next_scan_time.strftime("%H:%M %d/%m")
+            
+            # Repeated clicks with an unchanged schedule keep the current tooltip
+            next_scan_epoch = next_scan_time.timestamp() if next_scan_time else None
+            if self._status_tooltip is not None and next_scan_epoch == self._status_next_scan_epoch:
+                return
+            
+            next_scan = next_scan_time.strftime(_NEXT_SCAN_FORMAT) if next_scan_time else "Not scheduled"
             
             # Show status
-            status_msg = f"Next scan: {next_scan}"
-            self.tray_icon.setToolTip(f"Media Folder Icon Manager\n{status_msg}")
+            self._status_tooltip = f"Media Folder Icon Manager\nNext scan: {next_scan}"
+            self._status_next_scan_epoch = next_scan_epoch
+            self.tray_icon.setToolTip(self._status_tooltip)
             
         except Exception as e:
             logger.debug(f"Failed to show status: {e}")
@@ -275,6 +304,8 @@ class TrayManager(QObject):
             scanning: Whether a scan is currently in progress
         """
         try:
+            # The status tooltip is replaced, so the next click must rebuild it
+            self._status_tooltip = None
             if scanning:
                 self.tray_icon.setToolTip("Media Folder Icon Manager - Scanning...")
                 # Could change icon to indicate scanning
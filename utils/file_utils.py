@@ -6,6 +6,8 @@ import os
 import re
 import logging
 import subprocess
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Tuple, Dict, Any
 import ctypes
@@ -15,10 +17,99 @@ from ctypes import wintypes
 logger = logging.getLogger(__name__)
 
 
+# Windows API bindings; WinDLL objects are loaded once, unlike windll's per-call attribute lookups
+_kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+_shell32 = ctypes.WinDLL('shell32', use_last_error=True)
+
 # Windows API constants
 SHGFI_ICON = 0x100
 SHGFI_ICONLOCATION = 0x1000
-SHGetFileInfo = ctypes.windll.shell32.SHGetFileInfoW
+SHGetFileInfo = _shell32.SHGetFileInfoW
+
+FILE_ATTRIBUTE_READONLY = 0x1
+FILE_ATTRIBUTE_HIDDEN = 0x2
+FILE_ATTRIBUTE_SYSTEM = 0x4
+FILE_ATTRIBUTE_NORMAL = 0x80
+SHCNE_UPDATEDIR = 0x00001000
+SHCNE_ASSOCCHANGED = 0x08000000
+SHCNF_PATHW = 0x0005
+SHCNF_FLUSH = 0x1000
+
+# Flags for rewriting desktop.ini in create_desktop_ini
+_DESKTOP_INI_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# Bound once with explicit argument types, so calls skip ctypes' per-call inference
+_SetFileAttributesW = _kernel32.SetFileAttributesW
+_SetFileAttributesW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD]
+_SetFileAttributesW.restype = wintypes.BOOL
+
+_SHChangeNotify = _shell32.SHChangeNotify
+_SHChangeNotify.argtypes = [wintypes.LONG, wintypes.UINT, ctypes.c_void_p, ctypes.c_void_p]
+_SHChangeNotify.restype = None
+
+# Lowercase extensions recognised as video files
+VIDEO_EXTENSIONS = frozenset({
+    '.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm',
+    '.m4v', '.mpg', '.mpeg', '.3gp', '.ts', '.mts'
+})
+
+# Threads listing directories in parallel during a movie scan; scandir releases
+# the GIL, so this hides per-directory latency on network shares
+_SCAN_WORKERS = 16
+
+# Title parsing patterns, compiled once at import
+_YEAR_PATTERNS = [re.compile(p) for p in (
+    r'\((\d{4})\)',  # (2010)
+    r'\[(\d{4})\]',  # [2010]
+    r'\.(\d{4})\.',  # .2010.
+    r'\s(\d{4})\s',  # 2010 
+    r'\.(\d{4})$',   # .2010 (at end)
+)]
+_BRACKETED_RE = re.compile(r'\s*[\(\[].*?[\)\]]')
+_SEPARATOR_RE = re.compile(r'[\.\-_]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+_UNSAFE_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_SEASON_FOLDER_RE = re.compile(r'season\s*\d+', re.IGNORECASE)
+
+# Common video quality indicators stripped from titles
+QUALITY_TERMS = (
+    'bluray', 'bdrip', 'dvdrip', 'webrip', 'hdtv', 'hdcam',
+    '720p', '1080p', '4k', 'uhd', 'x264', 'x265', 'hevc',
+    'aac', 'dts', 'ac3', 'extended', 'unrated', 'directors.cut'
+)
+# One alternation, so a title is scanned once rather than once per term
+_QUALITY_TERMS_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(term) for term in QUALITY_TERMS) + r')\b', re.IGNORECASE
+)
+
+
+def has_video_extension(name: str) -> bool:
+    """
+    Check if a file name has a video extension, without building a Path.
+    
+    Matches Path.suffix semantics: a leading dot (e.g. ".mkv") is not an extension.
+    
+    Args:
+        name: File name
+        
+    Returns:
+        True if the name ends in a video extension, False otherwise
+    """
+    dot = name.rfind('.')
+    return dot > 0 and name[dot:].lower() in VIDEO_EXTENSIONS
+
+
+def is_season_folder(name: str) -> bool:
+    """
+    Check if a folder name looks like a season folder ("Season 1", "Show - season02", ...).
+    
+    Args:
+        name: Folder name
+        
+    Returns:
+        True if the name contains "season" followed by a number, False otherwise
+    """
+    return _SEASON_FOLDER_RE.search(name) is not None
 
 
 def is_video_file(file_path: Path) -> bool:
@@ -31,11 +122,7 @@ def is_video_file(file_path: Path) -> bool:
     Returns:
         True if it's a video file, False otherwise
     """
-    video_extensions = {
-        '.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm',
-        '.m4v', '.mpg', '.mpeg', '.3gp', '.ts', '.mts'
-    }
-    return file_path.suffix.lower() in video_extensions
+    return has_video_extension(file_path.name)
 
 
 def extract_year_from_filename(filename: str) -> Optional[int]:
@@ -49,16 +136,8 @@ def extract_year_from_filename(filename: str) -> Optional[int]:
         Year as integer or None if not found
     """
     # Look for 4-digit year in parentheses or brackets
-    year_patterns = [
-        r'\((\d{4})\)',  # (2010)
-        r'\[(\d{4})\]',  # [2010]
-        r'\.(\d{4})\.',  # .2010.
-        r'\s(\d{4})\s',  # 2010 
-        r'\.(\d{4})$',   # .2010 (at end)
-    ]
-    
-    for pattern in year_patterns:
-        match = re.search(pattern, filename)
+    for pattern in _YEAR_PATTERNS:
+        match = pattern.search(filename)
         if match:
             year = int(match.group(1))
             # Sanity check: reasonable movie year range
@@ -68,6 +147,8 @@ def extract_year_from_filename(filename: str) -> Optional[int]:
     return None
 
 
+# Pure function of its input; episodes and re-scans repeat the same names
+@lru_cache(maxsize=8192)
 def clean_title(title: str) -> str:
     """
     Clean movie/TV show title for API searches.
@@ -79,21 +160,14 @@ def clean_title(title: str) -> str:
         Cleaned title string
     """
     # Remove year and extra info in parentheses/brackets
-    title = re.sub(r'\s*[\(\[].*?[\)\]]', '', title)
+    title = _BRACKETED_RE.sub('', title)
     
     # Remove common video quality indicators
-    quality_terms = [
-        'bluray', 'bdrip', 'dvdrip', 'webrip', 'hdtv', 'hdcam',
-        '720p', '1080p', '4k', 'uhd', 'x264', 'x265', 'hevc',
-        'aac', 'dts', 'ac3', 'extended', 'unrated', 'directors.cut'
-    ]
-    
-    for term in quality_terms:
-        title = re.sub(rf'\b{re.escape(term)}\b', '', title, flags=re.IGNORECASE)
+    title = _QUALITY_TERMS_RE.sub('', title)
     
     # Clean up extra spaces and dots
-    title = re.sub(r'[\.\-_]+', ' ', title)
-    title = re.sub(r'\s+', ' ', title)
+    title = _SEPARATOR_RE.sub(' ', title)
+    title = _WHITESPACE_RE.sub(' ', title)
     
     return title.strip()
 
@@ -111,29 +185,73 @@ def scan_movies(directory: Path) -> List[Dict[str, Any]]:
     movies = []
     
     try:
-        for file_path in directory.rglob('*'):
-            if file_path.is_file() and is_video_file(file_path):
-                filename = file_path.stem
-                year = extract_year_from_filename(filename)
-                title = clean_title(filename)
-                
-                if title:  # Only add if we could extract a title
-                    movies.append({
-                        'path': file_path,
-                        'filename': filename,
-                        'title': title,
-                        'year': year,
-                        'directory': file_path.parent
-                    })
+        # Directory listings are I/O-bound, so fan them out over a thread pool;
+        # title parsing is CPU-bound and runs afterwards on this thread
+        video_paths = []
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+            pending = {executor.submit(_list_movie_directory, str(directory))}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs = future.result()
+                    video_paths.extend(files)
+                    pending.update(executor.submit(_list_movie_directory, subdir) for subdir in subdirs)
+        
+        # Completion order varies between runs; keep the result stable
+        video_paths.sort()
+        
+        for path in video_paths:
+            # Parse the name from the str path; a Path is only built for the result
+            filename = os.path.splitext(os.path.basename(path))[0]
+            year = extract_year_from_filename(filename)
+            title = clean_title(filename)
+            
+            if title:  # Only add if we could extract a title
+                file_path = Path(path)
+                movies.append({
+                    'path': file_path,
+                    'filename': filename,
+                    'title': title,
+                    'year': year,
+                    'directory': file_path.parent
+                })
                     
-        logger.info(f"Found {len(movies)} movies in {directory}")
+        logger.info("Found %s movies in %s", len(movies), directory)
         return movies
         
     except Exception as e:
-        logger.error(f"Failed to scan movies in {directory}: {e}")
+        logger.error("Failed to scan movies in %s: %s", directory, e)
         return []
 
 
+def _list_movie_directory(path: str) -> Tuple[List[str], List[str]]:
+    """
+    List one directory for scan_movies using os.scandir.
+    
+    Entry types come from the cached directory listing, so only video-named
+    files need any further checks. Directory symlinks are not followed;
+    symlinked video files are included, as with rglob.
+    
+    Args:
+        path: Directory to list
+        
+    Returns:
+        Tuple of (video file paths, subdirectory paths)
+    """
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif has_video_extension(entry.name) and entry.is_file():
+                    files.append(entry.path)
+    except OSError as e:
+        logger.debug("Skipping unreadable directory %s: %s", path, e)
+    return files, subdirs
+
+
 def scan_tv_shows(directory: Path) -> List[Dict[str, Any]]:
     """
     Scan directory for TV show folders.
@@ -148,33 +266,58 @@ def scan_tv_shows(directory: Path) -> List[Dict[str, Any]]:
     
     try:
         # Look for show directories (containing season folders)
-        for show_dir in directory.iterdir():
-            if not show_dir.is_dir():
-                continue
-                
-            # Check if this directory contains season folders
-            season_folders = []
-            for item in show_dir.iterdir():
-                if item.is_dir() and re.search(r'season\s*\d+', item.name, re.IGNORECASE):
-                    season_folders.append(item)
+        with os.scandir(directory) as it:
+            show_dirs = [entry.path for entry in it if entry.is_dir()]
+        
+        for show_dir in show_dirs:
+            # Check if this directory contains season folders; the same listing
+            # tells whether it already has a desktop.ini, without another stat
+            season_folders, has_icon = _list_show_directory(show_dir)
             
             if season_folders:
                 # This looks like a TV show directory
-                title = clean_title(show_dir.name)
+                show_path = Path(show_dir)
+                title = clean_title(show_path.name)
                 tv_shows.append({
-                    'path': show_dir,
+                    'path': show_path,
                     'title': title,
-                    'season_folders': season_folders
+                    'season_folders': season_folders,
+                    'has_custom_icon': has_icon
                 })
         
-        logger.info(f"Found {len(tv_shows)} TV shows in {directory}")
+        logger.info("Found %s TV shows in %s", len(tv_shows), directory)
         return tv_shows
         
     except Exception as e:
-        logger.error(f"Failed to scan TV shows in {directory}: {e}")
+        logger.error("Failed to scan TV shows in %s: %s", directory, e)
         return []
 
 
+def _list_show_directory(path: str) -> Tuple[List[Path], bool]:
+    """
+    List one candidate show directory for scan_tv_shows using os.scandir.
+    
+    Args:
+        path: Directory to list
+        
+    Returns:
+        Tuple of (season folder paths, whether the directory has a desktop.ini)
+    """
+    season_folders = []
+    has_icon = False
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir():
+                    if is_season_folder(entry.name):
+                        season_folders.append(Path(entry.path))
+                elif entry.name.lower() == 'desktop.ini':
+                    has_icon = True
+    except OSError as e:
+        logger.debug("Skipping unreadable directory %s: %s", path, e)
+    return season_folders, has_icon
+
+
 def create_desktop_ini(folder_path: Path, icon_path: Path) -> bool:
     """
     Create desktop.ini file to set custom folder icon.
@@ -189,39 +332,56 @@ def create_desktop_ini(folder_path: Path, icon_path: Path) -> bool:
     try:
         desktop_ini_path = folder_path / "desktop.ini"
         
-        # Create desktop.ini content
-        ini_content = f"""[.ShellClassInfo]
-IconResource={icon_path.as_posix()},0
-[ViewState]
-Mode=
-Vid=
-FolderType=Generic
-"""
+        # Create desktop.ini content, with the CRLF line endings INI files use on Windows
+        ini_content = (
+            "[.ShellClassInfo]\r\n"
+            f"IconResource={icon_path.as_posix()},0\r\n"
+            "[ViewState]\r\n"
+            "Mode=\r\n"
+            "Vid=\r\n"
+            "FolderType=Generic\r\n"
+        ).encode('utf-8')
         
-        # Write desktop.ini file
-        with open(desktop_ini_path, 'w', encoding='utf-8') as f:
-            f.write(ini_content)
+        # Write desktop.ini file with a single raw write; O_BINARY stops the
+        # Windows C runtime from translating the line endings again
+        fd = os.open(desktop_ini_path, _DESKTOP_INI_FLAGS)
+        try:
+            os.write(fd, ini_content)
+        finally:
+            os.close(fd)
         
         # Set file attributes: hidden and system
-        ctypes.windll.kernel32.SetFileAttributesW(
-            str(desktop_ini_path),
-            0x2 | 0x4  # FILE_ATTRIBUTE_HIDDEN | FILE_ATTRIBUTE_SYSTEM
-        )
+        _SetFileAttributesW(str(desktop_ini_path), FILE_ATTRIBUTE_HIDDEN | FILE_ATTRIBUTE_SYSTEM)
         
         # Set folder attributes: read-only to enable custom icon
-        ctypes.windll.kernel32.SetFileAttributesW(
-            str(folder_path),
-            0x1  # FILE_ATTRIBUTE_READONLY
-        )
+        _SetFileAttributesW(str(folder_path), FILE_ATTRIBUTE_READONLY)
         
-        logger.info(f"Created desktop.ini for {folder_path}")
+        logger.info("Created desktop.ini for %s", folder_path)
         return True
         
     except Exception as e:
-        logger.error(f"Failed to create desktop.ini for {folder_path}: {e}")
+        logger.error("Failed to create desktop.ini for %s: %s", folder_path, e)
         return False
 
 
+def set_file_attributes(path: Path, attributes: int) -> bool:
+    """
+    Set the Windows attributes of a file or folder.
+    
+    Args:
+        path: Path to the file or folder
+        attributes: FILE_ATTRIBUTE_* flags
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    if _SetFileAttributesW(str(path), attributes):
+        return True
+    
+    logger.debug("SetFileAttributesW failed for %s: %s", path, ctypes.WinError(ctypes.get_last_error()))
+    return False
+
+
 def refresh_folder_icon(folder_path: Path) -> bool:
     """
     Refresh folder icon in Windows Explorer.
@@ -232,28 +392,38 @@ def refresh_folder_icon(folder_path: Path) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    return refresh_folder_icons_bulk([folder_path])
+
+
+def refresh_folder_icons_bulk(folder_paths: List[Path]) -> bool:
+    """
+    Refresh the icons of several folders in Windows Explorer.
+    
+    Explorer's icon association cache is flushed once for the whole batch, and
+    then each folder gets its own update notification.
+    
+    Args:
+        folder_paths: Paths to the folders
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    if not folder_paths:
+        return True
+    
     try:
         # Use SHChangeNotify to refresh the folder
-        ctypes.windll.shell32.SHChangeNotify(
-            0x8000000,  # SHCNE_ASSOCCHANGED
-            0x1000,     # SHCNF_FLUSH
-            None,
-            None
-        )
+        _SHChangeNotify(SHCNE_ASSOCCHANGED, SHCNF_FLUSH, None, None)
         
-        # Also try to refresh the specific folder
-        ctypes.windll.shell32.SHChangeNotify(
-            0x40,       # SHCNE_UPDATEDIR
-            0x0000,     # SHCNF_PATH
-            str(folder_path),
-            None
-        )
+        # Also refresh each specific folder
+        for folder_path in folder_paths:
+            _SHChangeNotify(SHCNE_UPDATEDIR, SHCNF_PATHW, ctypes.c_wchar_p(str(folder_path)), None)
         
-        logger.debug(f"Refreshed folder icon for {folder_path}")
+        logger.debug("Refreshed folder icons for %s folders", len(folder_paths))
         return True
         
     except Exception as e:
-        logger.error(f"Failed to refresh folder icon for {folder_path}: {e}")
+        logger.error("Failed to refresh folder icons: %s", e)
         return False
 
 
@@ -261,6 +431,9 @@ def has_custom_icon(folder_path: Path) -> bool:
     """
     Check if folder already has a custom icon.
     
+    This costs a stat per folder; TV show items from scan_tv_shows already
+    carry a 'has_custom_icon' flag taken from the scan's directory listing.
+    
     Args:
         folder_path: Path to the folder
         
@@ -271,6 +444,8 @@ def has_custom_icon(folder_path: Path) -> bool:
     return desktop_ini_path.exists()
 
 
+# Pure function of its input, called for every cached poster and icon lookup
+@lru_cache(maxsize=8192)
 def get_safe_filename(title: str) -> str:
     """
     Convert title to safe filename for caching.
@@ -282,8 +457,8 @@ def get_safe_filename(title: str) -> str:
         Safe filename string
     """
     # Remove or replace unsafe characters
-    safe_chars = re.sub(r'[<>:"/\\|?*]', '_', title)
-    safe_chars = re.sub(r'\s+', '_', safe_chars)
+    safe_chars = _UNSAFE_CHARS_RE.sub('_', title)
+    safe_chars = _WHITESPACE_RE.sub('_', safe_chars)
     safe_chars = safe_chars.strip('._')
     
     # Limit length
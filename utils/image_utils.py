@@ -3,15 +3,45 @@ Image processing utilities for poster and icon management.
 """
 
 import logging
+import os
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import BinaryIO, Iterator, List, Optional, Tuple
 from PIL import Image, ImageOps
-import requests
-from io import BytesIO
+
+from api.http_session import get_shared_session
 
 
 logger = logging.getLogger(__name__)
 
+# Quality for re-encoded poster cache files; optimize=True would add a second Huffman pass
+_JPEG_QUALITY = 85
+
+# Write buffer for saving posters and icons, so an encode reaches disk in a few large writes
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Concurrent poster downloads in download_images; stays below the shared session's pool size
+_DOWNLOAD_WORKERS = 16
+
+
+@contextmanager
+def _open_for_save(path: Path) -> Iterator[BinaryIO]:
+    """
+    Open a file for an image save with a large write buffer.
+    
+    Like Image.save with a path, a partly written file is removed if the
+    save fails, so it is never mistaken for a cached poster or icon.
+    """
+    f = open(path, 'wb', buffering=_WRITE_BUFFER_SIZE)
+    try:
+        with f:
+            yield f
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+
 
 def download_image(url: str, timeout: int = 30) -> Optional[Image.Image]:
     """
@@ -24,17 +54,58 @@ def download_image(url: str, timeout: int = 30) -> Optional[Image.Image]:
     Returns:
         PIL Image object or None if failed
     """
+    return download_image_data(url, timeout)[0]
+
+
+def download_image_data(url: str, timeout: int = 30) -> Tuple[Optional[Image.Image], Optional[bytes]]:
+    """
+    Download an image from URL, keeping its encoded bytes.
+    
+    The bytes let cache_poster store a JPEG poster as downloaded instead of
+    re-encoding it. PIL would copy the non-seekable response stream into
+    memory anyway, so keeping them costs no extra buffering.
+    
+    Args:
+        url: Image URL to download
+        timeout: Request timeout in seconds
+        
+    Returns:
+        Tuple of (PIL Image, encoded bytes), or (None, None) if failed
+    """
     try:
-        response = requests.get(url, timeout=timeout, stream=True)
+        # The shared session keeps connections to the image hosts alive between posters
+        response = get_shared_session().get(url, timeout=timeout)
         response.raise_for_status()
         
-        # Load image from response content
-        image = Image.open(BytesIO(response.content))
-        return image
+        data = response.content
+        image = Image.open(BytesIO(data))
+        image.load()
+        return image, data
         
     except Exception as e:
-        logger.error(f"Failed to download image from {url}: {e}")
-        return None
+        logger.error("Failed to download image from %s: %s", url, e)
+        return None, None
+
+
+def download_images(urls: List[str], timeout: int = 30) -> List[Tuple[Optional[Image.Image], Optional[bytes]]]:
+    """
+    Download several images concurrently.
+    
+    Each URL is fetched with download_image_data on a thread pool, so the
+    round trips to the image host overlap instead of running one after another.
+    
+    Args:
+        urls: Image URLs to download
+        timeout: Request timeout in seconds
+        
+    Returns:
+        (PIL Image, encoded bytes) tuples ((None, None) for failed downloads), in the order of urls
+    """
+    if not urls:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(_DOWNLOAD_WORKERS, len(urls))) as executor:
+        return list(executor.map(lambda url: download_image_data(url, timeout), urls))
 
 
 def create_folder_icon(image: Image.Image, output_path: Path, sizes: Tuple[int, ...] = (16, 32, 48, 64, 128, 256)) -> bool:
@@ -53,35 +124,61 @@ def create_folder_icon(image: Image.Image, output_path: Path, sizes: Tuple[int,
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Prepare images for different sizes
-        icon_images = []
-        
-        for size in sizes:
-            # Resize image maintaining aspect ratio
-            resized = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
-            
-            # Convert to RGBA if not already
-            if resized.mode != 'RGBA':
-                resized = resized.convert('RGBA')
-            
+        # Fit the poster to the largest size once, then shrink each smaller size
+        # from the previous one, so the full-resolution source is resampled only once
+        sizes = sorted(set(sizes), reverse=True)
+        
+        # RGB posters are converted after fitting, on the small image; other modes
+        # (palette, greyscale, ...) first, so LANCZOS works on full colour
+        source = image if image.mode in ('RGB', 'RGBA') else image.convert('RGBA')
+        resized = ImageOps.fit(source, (sizes[0], sizes[0]), Image.Resampling.LANCZOS)
+        if resized.mode != 'RGBA':
+            resized = resized.convert('RGBA')
+        icon_images = [resized]
+        
+        for size in sizes[1:]:
+            resized = resized.resize((size, size), Image.Resampling.LANCZOS)
             icon_images.append(resized)
         
         # Save as .ico file
-        icon_images[0].save(
-            output_path,
-            format='ICO',
-            sizes=[(img.width, img.height) for img in icon_images],
-            append_images=icon_images[1:]
-        )
-        
-        logger.info(f"Created folder icon: {output_path}")
+        with _open_for_save(output_path) as f:
+            icon_images[0].save(
+                f,
+                format='ICO',
+                sizes=[(img.width, img.height) for img in icon_images],
+                append_images=icon_images[1:]
+            )
+        
+        logger.info("Created folder icon: %s", output_path)
         return True
         
     except Exception as e:
-        logger.error(f"Failed to create folder icon {output_path}: {e}")
+        logger.error("Failed to create folder icon %s: %s", output_path, e)
         return False
 
 
+def create_folder_icons_bulk(jobs: List[Tuple[Image.Image, Path]],
+                             sizes: Tuple[int, ...] = (16, 32, 48, 64, 128, 256)) -> List[bool]:
+    """
+    Create several .ico files concurrently.
+    
+    Pillow releases the GIL while it decodes, resamples and encodes, so icons
+    built with create_folder_icon on a thread pool spread over the CPU cores.
+    
+    Args:
+        jobs: (source image, output .ico path) pairs
+        sizes: Icon sizes to include in each .ico file
+        
+    Returns:
+        Success flag for each job, in the order of jobs
+    """
+    if len(jobs) <= 1:
+        return [create_folder_icon(image, output_path, sizes) for image, output_path in jobs]
+    
+    with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(jobs))) as executor:
+        return list(executor.map(lambda job: create_folder_icon(job[0], job[1], sizes), jobs))
+
+
 def resize_for_thumbnail(image: Image.Image, max_size: Tuple[int, int] = (300, 300)) -> Image.Image:
     """
     Resize image for use as video thumbnail.
@@ -112,11 +209,12 @@ def resize_for_thumbnail(image: Image.Image, max_size: Tuple[int, int] = (300, 3
         return image
         
     except Exception as e:
-        logger.error(f"Failed to resize image for thumbnail: {e}")
+        logger.error("Failed to resize image for thumbnail: %s", e)
         return image
 
 
-def cache_poster(image: Image.Image, cache_dir: Path, filename: str) -> Optional[Path]:
+def cache_poster(image: Image.Image, cache_dir: Path, filename: str,
+                 source_bytes: Optional[bytes] = None) -> Optional[Path]:
     """
     Cache a poster image to disk.
     
@@ -124,6 +222,8 @@ def cache_poster(image: Image.Image, cache_dir: Path, filename: str) -> Optional
         image: PIL Image to cache
         cache_dir: Cache directory path
         filename: Filename to save as (without extension)
+        source_bytes: Encoded bytes the image was decoded from (optional);
+            an RGB JPEG is then written as is instead of being re-encoded
         
     Returns:
         Path to cached image or None if failed
@@ -135,6 +235,11 @@ def cache_poster(image: Image.Image, cache_dir: Path, filename: str) -> Optional
         # Save as JPEG
         cache_path = cache_dir / f"{filename}.jpg"
         
+        if source_bytes is not None and image.format == 'JPEG' and image.mode == 'RGB':
+            cache_path.write_bytes(source_bytes)
+            logger.debug("Cached poster: %s", cache_path)
+            return cache_path
+        
         # Convert to RGB if needed
         if image.mode in ('RGBA', 'LA'):
             # Create white background
@@ -147,13 +252,14 @@ def cache_poster(image: Image.Image, cache_dir: Path, filename: str) -> Optional
         elif image.mode != 'RGB':
             image = image.convert('RGB')
         
-        image.save(cache_path, 'JPEG', quality=90, optimize=True)
+        with _open_for_save(cache_path) as f:
+            image.save(f, 'JPEG', quality=_JPEG_QUALITY)
         
-        logger.debug(f"Cached poster: {cache_path}")
+        logger.debug("Cached poster: %s", cache_path)
         return cache_path
         
     except Exception as e:
-        logger.error(f"Failed to cache poster {filename}: {e}")
+        logger.error("Failed to cache poster %s: %s", filename, e)
         return None
 
 
@@ -195,17 +301,21 @@ def clean_cache(cache_dir: Path, max_age_days: int = 30) -> int:
         current_time = time.time()
         deleted_count = 0
         
-        for file_path in cache_dir.glob("*.jpg"):
-            if file_path.is_file():
-                file_age = current_time - file_path.stat().st_mtime
+        # scandir yields the type (and on Windows the mtime) with each entry,
+        # instead of glob + is_file + stat per file
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith('.jpg') or not entry.is_file():
+                    continue
+                file_age = current_time - entry.stat().st_mtime
                 if file_age > max_age_seconds:
-                    file_path.unlink()
+                    os.unlink(entry.path)
                     deleted_count += 1
-                    logger.debug(f"Deleted old cache file: {file_path}")
+                    logger.debug("Deleted old cache file: %s", entry.path)
         
-        logger.info(f"Cleaned {deleted_count} old cache files")
+        logger.info("Cleaned %s old cache files", deleted_count)
         return deleted_count
         
     except Exception as e:
-        logger.error(f"Failed to clean cache: {e}")
+        logger.error("Failed to clean cache: %s", e)
         return 0
@@ -5,6 +5,8 @@ Logging configuration and utilities.
 import logging
 import logging.handlers
 import os
+import threading
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 
@@ -42,7 +44,7 @@ def setup_logging(log_level: str = "INFO") -> None:
     
     # File handler with rotation
     log_file = logs_dir / "media_folder_icon.log"
-    file_handler = logging.handlers.RotatingFileHandler(
+    file_handler = BufferedRotatingFileHandler(
         log_file,
         maxBytes=10 * 1024 * 1024,  # 10MB
         backupCount=5,
@@ -55,6 +57,89 @@ def setup_logging(log_level: str = "INFO") -> None:
     logging.getLogger(__name__).info("Logging initialized")
 
 
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that writes records in batches.
+    
+    RotatingFileHandler checks the file size and flushes the stream for every
+    record. This handler formats each record when it is emitted (so the log
+    level still filters before any formatting), but only writes and flushes
+    once `capacity` records are pending, a record at `flush_level` or above
+    arrives, `flush_interval` seconds have passed since the first pending
+    record, or the handler is flushed or closed (logging.shutdown() does both
+    at exit). Rollover is still decided per record, from the tracked file size.
+    """
+    
+    def __init__(self, filename, capacity: int = 1024, flush_level: int = logging.ERROR,
+                 flush_interval: float = 1.0, **kwargs):
+        super().__init__(filename, **kwargs)
+        self.capacity = capacity
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self._pending = []
+        self._flush_timer = None
+    
+    def emit(self, record):
+        """Format a record and queue it for the next batch write."""
+        try:
+            self._pending.append(self.format(record) + self.terminator)
+            if len(self._pending) >= self.capacity or record.levelno >= self.flush_level:
+                self.flush()
+            elif self._flush_timer is None:
+                # Bound how long a quiet period can leave records unwritten
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        """Write all pending records, rolling the file over where needed."""
+        self.acquire()
+        try:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            
+            if self._pending:
+                pending = self._pending
+                self._pending = []
+                self._write_records(pending)
+            super().flush()
+        finally:
+            self.release()
+    
+    def _write_records(self, records):
+        """Write formatted records, rolling over before any that would exceed maxBytes."""
+        if self.stream is None:
+            self.stream = self._open()
+        
+        if self.maxBytes <= 0:
+            self.stream.write(''.join(records))
+            return
+        
+        self.stream.seek(0, 2)
+        size = self.stream.tell()
+        segment = []
+        for msg in records:
+            # Never roll over an empty file, so an oversized record still gets written
+            if size and size + len(msg) >= self.maxBytes:
+                self.stream.write(''.join(segment))
+                segment = []
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+                size = 0
+            segment.append(msg)
+            size += len(msg)
+        self.stream.write(''.join(segment))
+    
+    def close(self):
+        """Write pending records before closing the file."""
+        self.flush()
+        super().close()
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance with the specified name.
@@ -69,29 +154,75 @@ def get_logger(name: str) -> logging.Logger:
 
 
 class GuiLogHandler(logging.Handler):
-    """Custom log handler that can emit logs to a GUI widget."""
+    """
+    Custom log handler that can emit logs to a GUI widget.
+    
+    Records are queued by emit and appended in one batch by a Qt timer running
+    in the GUI thread, so logging from worker threads never touches the widget
+    and a burst of records costs a single re-layout.
+    """
+    
+    # How often queued records are appended to the widget
+    FLUSH_INTERVAL_MS = 100
     
     def __init__(self, text_widget=None):
         super().__init__()
-        self.text_widget = text_widget
+        self.text_widget = None
+        self._pending = deque()
+        self._pending_lock = threading.Lock()
+        self._flush_timer = None
         self.setFormatter(logging.Formatter(
             '%(asctime)s - %(levelname)s - %(message)s',
             datefmt='%H:%M:%S'
         ))
+        if text_widget is not None:
+            self.set_widget(text_widget)
     
     def emit(self, record):
-        """Emit a log record to the GUI widget."""
+        """Queue a log record for the GUI widget."""
         if self.text_widget is not None:
             try:
                 msg = self.format(record)
-                # This should be called from the main thread
-                self.text_widget.append(msg)
+                with self._pending_lock:
+                    self._pending.append(msg)
+            except Exception:
+                pass  # Ignore errors when formatting for the GUI
+    
+    def _flush_pending(self):
+        """Append all queued records to the widget (runs in the GUI thread)."""
+        with self._pending_lock:
+            if not self._pending:
+                return
+            text = '\n'.join(self._pending)
+            self._pending.clear()
+        
+        if self.text_widget is not None:
+            try:
+                self.text_widget.append(text)
             except Exception:
                 pass  # Ignore errors when updating GUI
     
     def set_widget(self, widget):
-        """Set the target widget for log messages."""
+        """
+        Set the target widget for log messages.
+        
+        Must be called from the GUI thread, which owns the flush timer.
+        Passing None flushes the queue to the previous widget and stops the timer.
+        """
+        if self._flush_timer is not None:
+            self._flush_pending()
+            self._flush_timer.stop()
+        
         self.text_widget = widget
+        
+        if widget is not None:
+            if self._flush_timer is None:
+                from PySide6.QtCore import QTimer
+                
+                self._flush_timer = QTimer()
+                self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+                self._flush_timer.timeout.connect(self._flush_pending)
+            self._flush_timer.start()
 
 
 # Global GUI log handler instance
@@ -117,3 +248,4 @@ def remove_gui_logging() -> None:
     root_logger = logging.getLogger()
     if gui_log_handler in root_logger.handlers:
         root_logger.removeHandler(gui_log_handler)
+    gui_log_handler.set_widget(None)